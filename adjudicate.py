@@ -0,0 +1,129 @@
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+from rulesets import DEFAULT_RULESET, get_ruleset, ruleset_names
+from scrabble_core import ScrabbleGame
+
+_games = {}
+
+
+def _worker_game(ruleset):
+    game = _games.get(ruleset)
+    if game is None:
+        # A fixed RNG keeps these bag-less games out of the event log.
+        game = _games[ruleset] = ScrabbleGame(rng=random.Random(0), ruleset=ruleset)
+    return game
+
+
+def adjudicate(words, ruleset=DEFAULT_RULESET):
+    """Return (word, is_valid, score) for each word, using the worker's game for ruleset.
+
+    is_valid is None for words the dictionary could not check; they score 0.
+    """
+    game = _worker_game(ruleset)
+    results = []
+    for word in words:
+        is_valid = word.isascii() and word.isalpha() and game.dictionary_verdict(word.upper())
+        results.append((word, is_valid, game.calculate_score(word) if is_valid else 0))
+    return results
+
+
+def read_chunks(lines, chunk_size):
+    """Yield lists of up to chunk_size stripped, non-empty words."""
+    words = (line.strip() for line in lines)
+    words = (word for word in words if word)
+    while True:
+        chunk = list(islice(words, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(lines, output, output_format='csv', chunk_size=5000, workers=None, progress_every=2.0, ruleset=DEFAULT_RULESET):
+    """Adjudicate every word in lines, writing results to output in input order.
+
+    At most two chunks per worker are in flight, so memory stays bounded
+    however long the input is. Returns (words, valid, unverified) counts.
+    """
+    if get_ruleset(ruleset).validator.remote:
+        # Remote checks wait on the network, so threads sharing one client do.
+        workers = workers or 8
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        workers = workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=workers)
+
+    writer = csv.writer(output) if output_format == 'csv' else None
+    if writer:
+        writer.writerow(['word', 'valid', 'score'])
+
+    def write(results):
+        for word, is_valid, score in results:
+            if writer:
+                writer.writerow([word, '' if is_valid is None else int(is_valid), score])
+            else:
+                output.write(json.dumps({'word': word, 'valid': is_valid, 'score': score}) + '\n')
+
+    start = last_report = time.perf_counter()
+    done = valid = unverified = 0
+    pending = deque()
+
+    def finish_oldest():
+        nonlocal done, valid, unverified, last_report
+        results = pending.popleft().result()
+        write(results)
+        done += len(results)
+        valid += sum(1 for result in results if result[1])
+        unverified += sum(1 for result in results if result[1] is None)
+        now = time.perf_counter()
+        if progress_every and now - last_report >= progress_every:
+            last_report = now
+            print(f"{done} words, {done / (now - start):.0f} words/s, {valid} valid, {unverified} unverified",
+                  file=sys.stderr)
+
+    with pool:
+        for chunk in read_chunks(lines, chunk_size):
+            pending.append(pool.submit(adjudicate, chunk, ruleset))
+            while len(pending) >= 2 * workers or (pending and pending[0].done()):
+                finish_oldest()
+        while pending:
+            finish_oldest()
+    output.flush()
+    elapsed = time.perf_counter() - start
+    print(f"Adjudicated {done} words ({valid} valid, {unverified} unverified) in {elapsed:.1f} s, "
+          f"{done / elapsed if elapsed else 0:.0f} words/s", file=sys.stderr)
+    return done, valid, unverified
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate and score a file of words, one per line.")
+    parser.add_argument('input', nargs='?', default='-', help="word file, or - for stdin")
+    parser.add_argument('--output', '-o', default='-', help="result file, or - for stdout")
+    parser.add_argument('--format', choices=('csv', 'jsonl'), default='csv')
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--ruleset', default=DEFAULT_RULESET, choices=ruleset_names())
+    parser.add_argument('--progress-every', type=float, default=2.0, help="seconds between progress reports (0 for none)")
+    args = parser.parse_args()
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+    try:
+        run(source, target, args.format, args.chunk_size, args.workers, args.progress_every, args.ruleset)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from leave_values import load_default_leave_values, rank_plays
+from probability import unseen_tiles
+from rack import BLANK, LETTERS, RACK_SIZE, Rack
+from scrabble_core import ScrabbleGame
+from tile_bag import TileBag
+
+_worker_games = {}
+
+
+def _game(ruleset=None):
+    """The rollout worker's own game for a ruleset, used only for word finding and scoring."""
+    game = _worker_games.get(ruleset)
+    if game is None:
+        game = ScrabbleGame(word_cache={}, rng=random.Random(0), ruleset=ruleset)
+        if game.validator.lexicon is None:
+            raise RuntimeError("The AI player needs a local word list (see lexicon.WORD_LIST_PATH).")
+        # Build the word index now rather than during the first move.
+        game.best_plays(Rack('AEINRST'), 1)
+        _worker_games[ruleset] = game
+    return game
+
+
+def _warm_up(ruleset):
+    _game(ruleset)
+
+
+def _best_score(game, tiles):
+    plays = game.best_plays(Rack(tiles), 1)
+    return plays[0][1] if plays else 0
+
+
+def rollouts(candidates, rack, unseen, opponent_tiles, seconds, seed, ruleset=None):
+    """Simulate each candidate move until seconds have passed; return (totals, counts).
+
+    A rollout deals the opponent opponent_tiles of the unseen tiles, refills
+    our rack from the rest as the bag would, and scores the move plus our best
+    next play minus the opponent's best reply. A candidate word of None means
+    swapping the whole rack.
+    """
+    game = _game(ruleset)
+    rng = random.Random(seed)
+    deadline = time.monotonic() + seconds
+    # Every tile has a slot, even with no copies unseen, so a swapped rack
+    # always goes back in.
+    unseen_counts = dict.fromkeys(LETTERS + BLANK, 0)
+    unseen_counts.update(Counter(unseen))
+    totals = [0.0] * len(candidates)
+    counts = [0] * len(candidates)
+    while True:
+        for i, (word, score) in enumerate(candidates):
+            bag = TileBag(unseen_counts, rng)
+            opponent = bag.draw_many(min(opponent_tiles, len(bag)))
+            if word is None:
+                leave = Rack()
+                for tile in rack:
+                    bag.put_back(tile)
+                kept = bag.draw_many(min(len(rack), len(bag)))
+            else:
+                leave = Rack(rack)
+                leave.consume(word)
+                kept = bag.draw_many(min(RACK_SIZE - len(leave), len(bag)))
+            leave.add(kept)
+            totals[i] += score + _best_score(game, leave) - _best_score(game, opponent)
+            counts[i] += 1
+        if time.monotonic() >= deadline:
+            return totals, counts
+
+
+class MonteCarloPlayer:
+    """Computer opponent that picks its move by simulating the tiles it cannot see.
+
+    The top scoring words (and a rack swap) are each played out many times
+    against random deals of the unseen tiles, on a process pool, until
+    budget_ms runs out. workers=0 runs the rollouts in the calling process.
+    With a leave value table, candidates are the best by score plus leave.
+    """
+
+    def __init__(self, game, budget_ms=200, candidates=8, workers=None):
+        if game.validator.lexicon is None:
+            raise RuntimeError("The AI player needs a local word list (see lexicon.WORD_LIST_PATH).")
+        self.game = game
+        self.budget_ms = budget_ms
+        self.candidates = candidates
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.leaves = load_default_leave_values()
+        self.rng = random.Random()
+        self.pool = None
+        self.warming = []
+        if self.workers:
+            # Spawned workers do not inherit the GUI's threads or Tk state.
+            # Each one loads its game on start up; choose() waits for that
+            # before its clock starts.
+            self.pool = ProcessPoolExecutor(
+                self.workers, multiprocessing.get_context('spawn'), initializer=_warm_up, initargs=(game.ruleset.name,)
+            )
+            self.warming = [self.pool.submit(_warm_up, game.ruleset.name) for _ in range(self.workers)]
+
+    def choose(self, rack, unseen, opponent_tiles=RACK_SIZE):
+        """Return the word to play from rack, or None to swap tiles."""
+        for future in self.warming:
+            future.result()
+        self.warming = []
+        started = time.monotonic()
+        rack = list(rack)
+        if self.leaves is None:
+            candidates = self.game.best_plays(Rack(rack), self.candidates)
+        else:
+            candidates = rank_plays(self.game, Rack(rack), self.leaves, self.candidates)
+        if len(unseen) - opponent_tiles >= len(rack):
+            candidates.append((None, 0))
+        if len(candidates) <= 1:
+            return candidates[0][0] if candidates else None
+
+        seconds = max(0.0, self.budget_ms / 1000 - (time.monotonic() - started))
+        jobs = [(candidates, rack, unseen, opponent_tiles, seconds, self.rng.getrandbits(32), self.game.ruleset.name)
+                for _ in range(max(1, self.workers))]
+        if self.pool is None:
+            results = [rollouts(*jobs[0])]
+        else:
+            results = [future.result() for future in [self.pool.submit(rollouts, *job) for job in jobs]]
+
+        def equity(i):
+            return sum(r[0][i] for r in results) / sum(r[1][i] for r in results)
+        best = max(range(len(candidates)), key=lambda i: (equity(i), candidates[i][1]))
+        return candidates[best][0]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,107 @@
+import numpy as np
+
+from rack import LETTERS, Rack
+
+
+def letter_count_matrix(words):
+    """Return an N x 26 uint8 matrix with the letter counts of each word."""
+    words = [word.upper() for word in words]
+    lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
+    letters = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8).astype(np.int64) - ord('A')
+    if letters.size and (letters.min() < 0 or letters.max() >= 26):
+        raise ValueError("Words must only contain the letters A-Z.")
+    word_ids = np.repeat(np.arange(len(words)), lengths)
+    counts = np.bincount(word_ids * 26 + letters, minlength=len(words) * 26)
+    return counts.reshape(len(words), 26).astype(np.uint8)
+
+
+def score_vector(letter_scores):
+    """Return the letter scores as a 26-vector."""
+    return np.array([letter_scores.get(letter, 0) for letter in LETTERS], dtype=np.int32)
+
+
+def rack_matrix(racks):
+    """Return the letter counts (R x 26) and blank counts (R) of several racks."""
+    racks = [rack if isinstance(rack, Rack) else Rack(rack) for rack in racks]
+    counts = np.array([rack.counts for rack in racks], dtype=np.int8).reshape(len(racks), 26)
+    blanks = np.array([rack.blanks for rack in racks], dtype=np.int16)
+    return counts, blanks
+
+
+class LetterMatrix:
+    """Word list held as a letter-count matrix, for scoring and checking it
+    against racks in whole-array operations instead of word by word."""
+
+    def __init__(self, words, letter_scores):
+        self.words = list(words)
+        self.counts = letter_count_matrix(self.words)
+        self.letter_scores = score_vector(letter_scores)
+        self.scores = self.counts.astype(np.int32) @ self.letter_scores
+        self.columns = np.ascontiguousarray(self.counts.T, dtype=np.int8)
+
+    def _rack_chunks(self, racks, chunk_size):
+        counts, blanks = rack_matrix(racks)
+        if chunk_size is None:
+            chunk_size = max(1, (1 << 22) // max(1, len(self.words)))
+        for start in range(0, len(counts), chunk_size):
+            yield start, counts[start:start + chunk_size], blanks[start:start + chunk_size]
+
+    def _feasible_chunks(self, racks, chunk_size):
+        # Feasibility alone: just the blanks each rack is short by, per word.
+        for start, chunk, blanks in self._rack_chunks(racks, chunk_size):
+            shortfall = np.zeros((len(chunk), len(self.words)), dtype=np.int16)
+            for letter in range(26):
+                column = self.columns[letter]
+                if column.any():
+                    shortfall += np.maximum(column[None, :] - chunk[:, letter, None], 0)
+            yield start, shortfall <= blanks[:, None]
+
+    def _chunks(self, racks, chunk_size):
+        # Yields (start, feasible, lost) per chunk of racks: whether each rack
+        # can make each word, and the score of the letters it needs blanks for.
+        # Working one letter column at a time keeps intermediates at R x N.
+        for start, chunk, blanks in self._rack_chunks(racks, chunk_size):
+            shortfall = np.zeros((len(chunk), len(self.words)), dtype=np.int16)
+            lost = np.zeros((len(chunk), len(self.words)), dtype=np.int32)
+            for letter in range(26):
+                column = self.columns[letter]
+                if not column.any():
+                    continue
+                missing = np.maximum(column[None, :] - chunk[:, letter, None], 0)
+                shortfall += missing
+                if self.letter_scores[letter]:
+                    lost += missing * self.letter_scores[letter]
+            yield start, shortfall <= blanks[:, None], lost
+
+    def feasible(self, racks, chunk_size=None):
+        """Return an R x N bool mask of which words each rack can make."""
+        mask = np.zeros((len(racks), len(self.words)), dtype=bool)
+        for start, feasible in self._feasible_chunks(racks, chunk_size):
+            mask[start:start + len(feasible)] = feasible
+        return mask
+
+    def _scored_chunks(self, racks, chunk_size):
+        for start, feasible, lost in self._chunks(racks, chunk_size):
+            yield start, np.where(feasible, self.scores[None, :] - lost, -1)
+
+    def rack_scores(self, racks, chunk_size=None):
+        """Return an R x N matrix of what each word scores from each rack, -1 where it can't be made.
+
+        Letters covered by blanks score zero, as in ScrabbleGame.calculate_score.
+        """
+        scores = np.full((len(racks), len(self.words)), -1, dtype=np.int32)
+        for start, chunk_scores in self._scored_chunks(racks, chunk_size):
+            scores[start:start + len(chunk_scores)] = chunk_scores
+        return scores
+
+    def best_plays(self, racks, chunk_size=None):
+        """Return the best word and its score for each rack (None and -1 if there is none)."""
+        if not self.words:
+            return [(None, -1)] * len(racks)
+        results = []
+        for _, chunk_scores in self._scored_chunks(racks, chunk_size):
+            best = chunk_scores.argmax(axis=1)
+            for row, index in enumerate(best):
+                score = int(chunk_scores[row, index])
+                results.append((self.words[index] if score >= 0 else None, score))
+        return results
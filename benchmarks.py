@@ -0,0 +1,274 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bloom import BloomFilter
+from check_import_budget import measure_import
+from dictionary_client import DictionaryClient, TokenBucket
+from dictionary_stub import StubDictionaryServer
+from game_session import GameSession
+from lexicon import Lexicon, MappedLexicon
+from rack import Rack
+from scrabble_core import ScrabbleGame
+from simulation import greedy_strategy, play_game
+import snapshot
+from validators import DictionaryAPIValidator, LexiconValidator, PrefilteredValidator
+from word_cache import PersistentWordCache
+
+LETTER_WEIGHTS = 'AAAAAAAAABBCCDDDDEEEEEEEEEEEEFFGGGHHIIIIIIIIIJKLLLLMMNNNNNNOOOOOOOOPPQRRRRRRSSSSTTTTTTUUUUVVWWXYYZ'
+
+
+def synthetic_words(count, seed=0):
+    """Reproducible word-like strings drawn with the tile frequencies."""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add(''.join(rng.choice(LETTER_WEIGHTS) for _ in range(rng.randint(2, 8))))
+    return sorted(words)
+
+
+def measure(function, repeat, setup=None, number=1):
+    """Time function and return per-call latency statistics in microseconds.
+
+    Takes repeat samples of number back-to-back calls each; setup, if given,
+    makes the argument for each sample and is not timed.
+    """
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        for _ in range(number):
+            function(argument) if setup else function()
+        timings.append((time.perf_counter() - start) * 1e6 / number)
+    timings.sort()
+    return {
+        'runs': repeat * number,
+        'mean_us': statistics.fmean(timings),
+        'p50_us': timings[len(timings) // 2],
+        'p95_us': timings[int(len(timings) * 0.95)],
+        'max_us': timings[-1],
+        'ops_per_s': repeat / (sum(timings) / 1e6) if sum(timings) else float('inf'),
+    }
+
+
+def bench_validation(words, validator, repeat, latency):
+    results = {}
+    rng = random.Random(1)
+    sample = rng.sample(words, min(repeat, len(words)))
+    nonsense = [word + 'QQ' for word in sample]
+
+    game = ScrabbleGame(validator=validator, word_cache={})
+    results['lexicon_lookup'] = measure(lambda: game.validator.is_valid(rng.choice(sample)), repeat, number=100)
+
+    with StubDictionaryServer(words, latency=latency) as server:
+        client = DictionaryClient(server.url, rate_limiter=TokenBucket(rate=1e6, capacity=1e6, max_rate=1e6))
+        remote = DictionaryAPIValidator(client)
+        lookups = iter(sample + nonsense)
+        game = ScrabbleGame(validator=remote, word_cache={})
+        results['remote_cold'] = measure(lambda: game.is_valid_dictionary_word(next(lookups)), len(sample) * 2)
+        results['remote_warm_memory_cache'] = measure(
+            lambda: game.is_valid_dictionary_word(rng.choice(sample)), repeat, number=100
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PersistentWordCache(os.path.join(directory, 'cache.sqlite3'))
+            game = ScrabbleGame(validator=remote, word_cache=cache)
+            for word in sample + nonsense:
+                game.is_valid_dictionary_word(word)
+            lookups = iter(sample + nonsense)
+            results['remote_warm_persistent_cache'] = measure(
+                lambda: game.is_valid_dictionary_word(next(lookups)), len(sample) * 2
+            )
+            cache.close()
+
+        game = ScrabbleGame(validator=PrefilteredValidator(BloomFilter.from_words(words), remote), word_cache={})
+        lookups = iter(nonsense)
+        results['remote_prefilter_reject'] = measure(lambda: game.is_valid_dictionary_word(next(lookups)), len(nonsense))
+
+        start = time.perf_counter()
+        remote.is_valid_many([word + 'X' for word in sample])
+        results['remote_batch_per_word_us'] = (time.perf_counter() - start) * 1e6 / len(sample)
+        client.close()
+    return results
+
+
+def bench_game(validator, repeat):
+    results = {}
+    game = ScrabbleGame(validator=validator, rng=random.Random(0))
+
+    def draw_and_return():
+        game.return_tiles(game.draw_tiles(7))
+    results['draw_tiles_7'] = measure(draw_and_return, repeat, number=10)
+
+    racks = [Rack(game.draw_tiles(7)) for _ in range(10)]
+    for rack in racks:
+        game.return_tiles(list(rack))
+    plays = [game.best_plays(rack, 1) for rack in racks]
+    words = [play[0][0] for play in plays if play]
+    pairs = [(play[0][0], rack) for play, rack in zip(plays, racks) if play]
+    results['calculate_score'] = measure(lambda: game.calculate_score(random.choice(words)), repeat, number=100)
+    results['is_valid_word'] = measure(lambda: game.is_valid_word(*random.choice(pairs)), repeat, number=100)
+
+    def replenish(rack):
+        game.replenish_tiles(rack)
+        game.return_tiles(list(rack))
+
+    results['replenish_tiles'] = measure(
+        replenish, repeat, setup=lambda: Rack(game.draw_tiles(3))
+    )
+
+    def fresh_session():
+        return GameSession(ScrabbleGame(validator=validator, rng=random.Random(random.random())))
+
+    def full_turn(session):
+        # What submit_word or the CLI loop does for one accepted word.
+        word = greedy_strategy(session.game, session.current.rack, None)
+        if word is None or not session.play(word)[0]:
+            session.skip()
+
+    results['full_turn'] = measure(full_turn, repeat, setup=fresh_session)
+    session = fresh_session()
+    full_turn(session)
+    data = snapshot.dumps(session)
+    results['snapshot_dumps'] = measure(lambda: snapshot.dumps(session), repeat, number=100)
+    results['snapshot_loads'] = measure(lambda: snapshot.loads(data, validator, {}), repeat, number=100)
+    results['hint_uncached'] = measure(
+        lambda rack: game.best_plays(rack), repeat,
+        setup=lambda: Rack(random.Random(random.random()).sample(LETTER_WEIGHTS, 7))
+    )
+
+    start = time.perf_counter()
+    games = max(1, repeat // 10)
+    for seed in range(games):
+        play_game(seed, validator=validator)
+    results['headless_games_per_s'] = games / (time.perf_counter() - start)
+    return results
+
+
+def bench_memory(validator, games):
+    """Bytes allocated per live game, measured with tracemalloc over many games."""
+    results = {}
+    makers = {
+        'memory_per_game_bytes': lambda seed: ScrabbleGame(validator=validator, rng=random.Random(seed)),
+        'memory_per_session_bytes': lambda seed: GameSession(ScrabbleGame(validator=validator, rng=random.Random(seed))),
+    }
+    for name, make in makers.items():
+        make(0)  # Let shared tables and caches be built outside the measurement.
+        gc.collect()
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        live = [make(seed) for seed in range(games)]
+        results[name] = (tracemalloc.get_traced_memory()[0] - start) / games
+        tracemalloc.stop()
+        del live
+    return results
+
+
+def run(word_count, repeat, latency):
+    words = synthetic_words(word_count)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'words.dawg')
+        start = time.perf_counter()
+        Lexicon(words).save(path)
+        compile_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        lexicon = MappedLexicon(path)
+        load_ms = (time.perf_counter() - start) * 1000
+        validator = LexiconValidator(lexicon)
+
+        results = {
+            'lexicon_compile_ms': compile_ms,
+            'lexicon_load_ms': load_ms,
+            'import_scrabble_core_ms': min(measure_import('scrabble_core')[0] for _ in range(3)),
+            'game_construction': measure(lambda: ScrabbleGame(validator=validator), repeat),
+        }
+        results.update(bench_validation(words, validator, repeat, latency))
+        results.update(bench_game(validator, repeat))
+        results.update(bench_memory(validator, repeat * 10))
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def headline(value):
+    """The number compared between runs: median latency, or the value itself."""
+    return value['p50_us'] if isinstance(value, dict) else value
+
+
+def compare(previous, current, threshold):
+    """Print how each benchmark moved; return the names that regressed past threshold."""
+    regressions = []
+    for name, value in current['results'].items():
+        if name not in previous['results']:
+            continue
+        old, new = headline(previous['results'][name]), headline(value)
+        if not old:
+            continue
+        ratio = new / old
+        # Rates get better as they grow, everything else as it shrinks.
+        worse = ratio < 1 / threshold if name.endswith('_per_s') else ratio > threshold
+        flag = '  REGRESSION' if worse else ''
+        print(f"{name:32} {old:12.2f} -> {new:12.2f}  x{ratio:.2f}{flag}")
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Scrabble game hot paths.")
+    parser.add_argument('--words', type=int, default=50000, help="size of the synthetic lexicon")
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.002, help="stub dictionary response delay in seconds")
+    parser.add_argument('--output', default=None, help="JSON file for the results (default bench_results/<commit>.json)")
+    parser.add_argument('--compare', default=None, help="earlier results file to compare against")
+    parser.add_argument('--threshold', type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'timestamp': time.time(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'parameters': {'words': args.words, 'repeat': args.repeat, 'latency': args.latency},
+        'results': run(args.words, args.repeat, args.latency),
+    }
+
+    output = args.output or os.path.join('bench_results', f"{commit or 'unknown'}.json")
+    if os.path.dirname(output):
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    for name, value in report['results'].items():
+        print(f"{name:32} {headline(value):12.2f}")
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        print(f"\nCompared with {args.compare} ({previous.get('commit')}):")
+        if compare(previous, report, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import math
+import os
+import struct
+import sys
+from hashlib import blake2b
+
+from lexicon import WORD_LIST_PATH
+
+BLOOM_PATH = os.environ.get(
+    'SCRABBLE_BLOOM',
+    os.path.splitext(WORD_LIST_PATH)[0] + '.bloom'
+)
+
+# Saved filter layout: a 20 byte header (magic, version, bit count, hash
+# count, word count) followed by the bit array.
+MAGIC = b'BLOM'
+VERSION = 1
+HEADER = struct.Struct('<4sIIII')
+
+
+class BloomFilter:
+    """Set of words that answers "definitely not" or "probably" in a few bits per word.
+
+    Words are compared in upper case. Each word sets hash_count bits chosen
+    by double hashing one 64-bit BLAKE2 digest.
+    """
+
+    def __init__(self, bit_count, hash_count, bits=None, word_count=0):
+        self.bit_count = max(8, bit_count)
+        self.hash_count = hash_count
+        self.bits = bits if bits is not None else bytearray((self.bit_count + 7) // 8)
+        self.word_count = word_count
+
+    @classmethod
+    def from_words(cls, words, bits_per_word=10):
+        """Build a filter sized for words; 10 bits per word gives about 1% false positives."""
+        words = list(words)
+        bloom = cls(len(words) * bits_per_word, max(1, round(bits_per_word * math.log(2))))
+        for word in words:
+            bloom.add(word)
+        return bloom
+
+    @classmethod
+    def from_file(cls, path=BLOOM_PATH):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not a saved Bloom filter.")
+        magic, version, bit_count, hash_count, word_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or len(data) != HEADER.size + (bit_count + 7) // 8:
+            raise ValueError(f"{path} is not a saved Bloom filter.")
+        return cls(bit_count, hash_count, bytearray(data[HEADER.size:]), word_count)
+
+    def _positions(self, word):
+        digest = int.from_bytes(blake2b(word.upper().encode(), digest_size=8).digest(), 'little')
+        first, step = digest & 0xFFFFFFFF, digest >> 32 | 1
+        bit_count = self.bit_count
+        return [(first + i * step) % bit_count for i in range(self.hash_count)]
+
+    def add(self, word):
+        bits = self.bits
+        for position in self._positions(word):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.word_count += 1
+
+    def __contains__(self, word):
+        # Same probes as _positions, but stops at the first clear bit.
+        digest = int.from_bytes(blake2b(word.upper().encode(), digest_size=8).digest(), 'little')
+        position, step = digest & 0xFFFFFFFF, digest >> 32 | 1
+        bits = self.bits
+        bit_count = self.bit_count
+        for _ in range(self.hash_count):
+            position %= bit_count
+            if not bits[position >> 3] & 1 << (position & 7):
+                return False
+            position += step
+        return True
+
+    def __len__(self):
+        return self.word_count
+
+    def false_positive_rate(self):
+        """Expected chance that a word not in the filter is reported as present."""
+        return (1 - math.exp(-self.hash_count * self.word_count / self.bit_count)) ** self.hash_count
+
+    def save(self, path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.bit_count, self.hash_count, self.word_count))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+
+def compile_word_list(source, target, bits_per_word=10):
+    """Build a Bloom filter from a word list file and save it to target."""
+    with open(source, encoding='utf-8') as f:
+        words = [line.strip() for line in f if line.strip().isascii() and line.strip().isalpha()]
+    bloom = BloomFilter.from_words(words, bits_per_word)
+    bloom.save(target)
+    return bloom
+
+
+_default_bloom = None
+
+
+def load_default_bloom():
+    """Load the saved filter at BLOOM_PATH once per process, or None if there is none."""
+    global _default_bloom
+    if _default_bloom is None and os.path.exists(BLOOM_PATH):
+        try:
+            _default_bloom = BloomFilter.from_file(BLOOM_PATH)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not load Bloom filter: {e}")
+    return _default_bloom
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (1, 3):
+        sys.exit("Usage: python bloom.py [WORD_LIST BLOOM_FILE]")
+    source, target = sys.argv[1:] or (WORD_LIST_PATH, BLOOM_PATH)
+    compiled = compile_word_list(source, target)
+    print(f"Compiled {len(compiled)} words into {target} "
+          f"({len(compiled.bits)} bytes, ~{compiled.false_positive_rate():.2%} false positives)")
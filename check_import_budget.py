@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+# Cold import of the rules engine, measured in a fresh interpreter.
+IMPORT_BUDGET_MS = 50
+HEADLESS_MODULES = ('scrabble_core', 'Word_Game_Final')
+GUI_AND_NETWORK_MODULES = ('tkinter', 'customtkinter', 'requests', 'sqlite3')
+
+
+def measure_import(module):
+    """Return the milliseconds a fresh interpreter spends importing module and
+    the GUI/network modules that came with it."""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"loaded = [m for m in {GUI_AND_NETWORK_MODULES!r} if m in sys.modules]\n"
+        "print(elapsed, ','.join(loaded))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout.split()
+    return float(output[0]), output[1].split(',') if len(output) > 1 else []
+
+
+def main():
+    failures = []
+    for module in HEADLESS_MODULES:
+        # The first run may have to write bytecode, so keep the best of a few.
+        results = [measure_import(module) for _ in range(3)]
+        elapsed = min(result[0] for result in results)
+        loaded = results[-1][1]
+        print(f"{module}: {elapsed:.1f} ms")
+        if elapsed > IMPORT_BUDGET_MS:
+            failures.append(f"{module} took {elapsed:.1f} ms to import (budget {IMPORT_BUDGET_MS} ms)")
+        if loaded:
+            failures.append(f"{module} imported {', '.join(loaded)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/{}"
+
+
+class TokenBucket:
+    """Rate limiter whose rate adapts to the server.
+
+    The rate is halved every time the server throttles us and creeps back up
+    after each successful request.
+    """
+
+    def __init__(self, rate=2.0, capacity=4, min_rate=0.2, max_rate=20.0, increase=0.1):
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def throttled(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0)
+
+    def succeeded(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+
+class DictionaryClient:
+    """Client for the Free Dictionary API.
+
+    Requests share a pooled keep-alive session, concurrent lookups of the
+    same word share one request, and batches are looked up in parallel. 429
+    and 5xx responses are retried with exponential backoff.
+    """
+
+    def __init__(self, url=API_URL, max_workers=8, rate_limiter=None, max_retries=4, backoff=0.5, timeout=10):
+        self.url = url
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._in_flight = {}
+        self._lock = threading.RLock()
+
+    def _fetch(self, word):
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(delay * random.uniform(0.5, 1.5))
+            delay = self.backoff * 2 ** attempt
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.get(self.url.format(word.lower()), timeout=self.timeout)
+            except requests.RequestException as e:
+                error = e
+                continue
+
+            if response.status_code == 429 or response.status_code >= 500:
+                error = f"HTTP {response.status_code}"
+                self.rate_limiter.throttled()
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = max(delay, int(retry_after))
+                continue
+
+            self.rate_limiter.succeeded()
+            return response.status_code == 200
+
+        print(f"Warning: Could not verify word due to API error: {error}")
+        return None
+
+    def lookup_async(self, word):
+        """Return a future for the validity of word, reusing any lookup already in flight."""
+        word = word.upper()
+        with self._lock:
+            future = self._in_flight.get(word)
+            if future is None:
+                future = self._pool.submit(self._fetch, word)
+                self._in_flight[word] = future
+                future.add_done_callback(lambda f: self._forget(word, f))
+        return future
+
+    def _forget(self, word, future):
+        with self._lock:
+            if self._in_flight.get(word) is future:
+                del self._in_flight[word]
+
+    def lookup(self, word):
+        """Check a single word; returns True, False or None if it could not be checked."""
+        return self.lookup_async(word).result()
+
+    def lookup_many(self, words):
+        """Check several words concurrently and return a dict of word -> result."""
+        futures = {word: self.lookup_async(word) for word in dict.fromkeys(words)}
+        return {word: future.result() for word, future in futures.items()}
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+        self.session.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def default_client():
+    """Return the process-wide client so every game shares one connection pool."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = DictionaryClient()
+        return _default_client
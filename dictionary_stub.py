@@ -0,0 +1,94 @@
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs
+    # add ~40 ms to every keep-alive response.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        stub = self.server.stub
+        word = unquote(self.path.rstrip('/').rsplit('/', 1)[-1]).upper()
+        with stub.lock:
+            stub.requests += 1
+            throttle = stub.throttle_every and stub.requests % stub.throttle_every == 0
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        if throttle:
+            status, body = 429, {"title": "Too Many Requests"}
+        elif word in stub.words:
+            status, body = 200, [{"word": word.lower()}]
+        else:
+            status, body = 404, {"title": "No Definitions Found"}
+
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if throttle:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubDictionaryServer:
+    """Local stand-in for the Free Dictionary API, for tests and benchmarks.
+
+    Words in the given set answer 200, everything else 404. latency adds a
+    delay to every response and throttle_every answers every nth request
+    with 429.
+    """
+
+    def __init__(self, words, host='127.0.0.1', port=0, latency=0.0, throttle_every=0):
+        self.words = {word.upper() for word in words}
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.requests = 0
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        """URL template to pass to DictionaryClient."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v2/entries/en/{{}}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        sys.exit("Usage: python dictionary_stub.py WORD_LIST [PORT]")
+    with open(sys.argv[1], encoding='utf-8') as f:
+        server = StubDictionaryServer((line.strip() for line in f), port=int(sys.argv[2]) if len(sys.argv) == 3 else 8000)
+    print(f"Serving {len(server.words)} words at {server.url}")
+    server.serve_forever()
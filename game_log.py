@@ -0,0 +1,258 @@
+import atexit
+import os
+import random
+import struct
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from rack import Rack
+
+EVENT_LOG_PATH = os.environ.get('SCRABBLE_EVENT_LOG')
+
+# Each record is a header (game id, event kind, payload length) and a payload.
+# The game id is the seed of the game's tile bag, so a game can be replayed
+# from its own records alone.
+RECORD = struct.Struct('<QBB')
+SCORE = struct.Struct('<H')
+START, TURN, DRAW, RETURN, PLAY, SKIP, END = range(7)
+
+ReplayedGame = namedtuple('ReplayedGame', 'seed scores racks remaining_tiles plays skips finished')
+
+
+class EventLog:
+    """Append-only binary log of game events.
+
+    Records are collected in memory and written in bulk once buffer_size
+    bytes have built up, on flush() and at close().
+    """
+
+    def __init__(self, path, buffer_size=1 << 16):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._file = open(path, 'ab')
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+
+    def append(self, game_id, kind, payload=b''):
+        with self._lock:
+            self._buffer += RECORD.pack(game_id, kind, len(payload))
+            self._buffer += payload
+            if len(self._buffer) >= self.buffer_size:
+                self._file.write(self._buffer)
+                self._buffer.clear()
+
+    def start_game(self, seed=None, ruleset=''):
+        """Log the start of a game played with the named ruleset and return its recorder."""
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        return GameRecorder(self, seed, ruleset)
+
+    def flush(self):
+        with self._lock:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GameRecorder:
+    """Writes one game's events to an EventLog; rng is the game's seeded tile bag RNG."""
+
+    __slots__ = ('log', 'seed', 'rng')
+
+    def __init__(self, log, seed, ruleset=''):
+        self.log = log
+        self.seed = seed
+        self.rng = random.Random(seed)
+        log.append(seed, START, ruleset.encode('ascii'))
+
+    @classmethod
+    def resume(cls, log, seed, rng):
+        """Carry on recording a game restored from a snapshot, whose bag draws from rng."""
+        recorder = cls.__new__(cls)
+        recorder.log = log
+        recorder.seed = seed
+        recorder.rng = rng
+        return recorder
+
+    def turn(self, player):
+        self.log.append(self.seed, TURN, bytes((player,)))
+
+    def draw(self, tiles):
+        self.log.append(self.seed, DRAW, ''.join(tiles).encode('ascii'))
+
+    def returned(self, tiles):
+        self.log.append(self.seed, RETURN, ''.join(tiles).encode('ascii'))
+
+    def play(self, word, score):
+        self.log.append(self.seed, PLAY, SCORE.pack(score) + word.encode('ascii'))
+
+    def skip(self):
+        self.log.append(self.seed, SKIP)
+
+    def end(self, scores):
+        self.log.append(self.seed, END, struct.pack(f'<{len(scores)}H', *scores))
+
+
+_default_log = None
+
+
+def default_event_log():
+    """The log named by SCRABBLE_EVENT_LOG, shared by the process, or None."""
+    global _default_log
+    if _default_log is None and EVENT_LOG_PATH:
+        _default_log = EventLog(EVENT_LOG_PATH)
+        atexit.register(_default_log.close)
+    return _default_log
+
+
+def read_events(path, chunk_size=1 << 20):
+    """Yield (game_id, kind, payload) for every record in the log, reading it in chunks."""
+    with open(path, 'rb') as f:
+        pending = b''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            data = pending + chunk if pending else chunk
+            offset = 0
+            end = len(data)
+            while offset + RECORD.size <= end:
+                game_id, kind, length = RECORD.unpack_from(data, offset)
+                start = offset + RECORD.size
+                if start + length > end:
+                    break
+                yield game_id, kind, data[start:start + length]
+                offset = start + length
+            pending = data[offset:]
+        if pending:
+            raise ValueError(f"{path} ends with a truncated record.")
+
+
+class _Replay:
+    """Replays one game's events against a fresh game seeded the same way."""
+
+    def __init__(self, seed, ruleset=None):
+        from scrabble_core import ScrabbleGame
+        from validators import WordValidator
+        # Logged plays were already validated, so replay never consults a dictionary.
+        self.game = ScrabbleGame(validator=WordValidator(), word_cache={}, rng=random.Random(seed), ruleset=ruleset)
+        self.seed = seed
+        self.racks = [Rack()]
+        self.scores = [0]
+        self.player = 0
+        self.plays = 0
+        self.skips = 0
+
+    def diverged(self, what):
+        return ValueError(f"Game {self.seed:016x} diverged from its log: {what}")
+
+    def apply(self, kind, payload):
+        game = self.game
+        rack = self.racks[self.player]
+        if kind == TURN:
+            self.player = payload[0]
+            while len(self.racks) <= self.player:
+                self.racks.append(Rack())
+                self.scores.append(0)
+        elif kind == DRAW:
+            tiles = game.bag.draw_many(len(payload))
+            if ''.join(tiles).encode('ascii') != payload:
+                raise self.diverged(f"drew {''.join(tiles)}, log has {payload.decode('ascii')}")
+            rack.add(tiles)
+        elif kind == RETURN:
+            tiles = payload.decode('ascii')
+            rack.remove(tiles)
+            for tile in tiles:
+                if tile in game.bag:
+                    game.bag.put_back(tile)
+        elif kind == PLAY:
+            logged_score, = SCORE.unpack_from(payload)
+            word = payload[SCORE.size:].decode('ascii')
+            score = game.calculate_score(word, rack.consume(word))
+            if score != logged_score:
+                raise self.diverged(f"{word} scored {score}, log has {logged_score}")
+            self.scores[self.player] += score
+            self.plays += 1
+        elif kind == SKIP:
+            self.skips += 1
+        elif kind == END:
+            scores = list(struct.unpack(f'<{len(payload) // 2}H', payload))
+            if scores != self.scores[:len(scores)]:
+                raise self.diverged(f"final scores {self.scores}, log has {scores}")
+        else:
+            raise self.diverged(f"unknown event kind {kind}")
+
+    def result(self, finished):
+        return ReplayedGame(
+            self.seed, self.scores, [rack.signature() for rack in self.racks],
+            len(self.game.bag), self.plays, self.skips, finished
+        )
+
+
+def replay(events):
+    """Replay a stream of (game_id, kind, payload) events, yielding each game as it ends.
+
+    Games may be interleaved; only the games still in progress are held in
+    memory. Games without an end record are yielded, unfinished, at the end.
+    Raises ValueError if a game does not reproduce exactly from its seed.
+    """
+    active = {}
+    for game_id, kind, payload in events:
+        if kind == START:
+            active[game_id] = _Replay(game_id, payload.decode('ascii') or None)
+            continue
+        game = active.get(game_id)
+        if game is None:
+            raise ValueError(f"Game {game_id:016x} has events before its start.")
+        game.apply(kind, payload)
+        if kind == END:
+            del active[game_id]
+            yield game.result(True)
+    for game in active.values():
+        yield game.result(False)
+
+
+def replay_game(path, seed):
+    """Replay the single game with the given seed from the log at path."""
+    events = (event for event in read_events(path) if event[0] == seed)
+    for game in replay(events):
+        return game
+    raise ValueError(f"No game {seed:016x} in {path}.")
+
+
+def main(argv):
+    if len(argv) not in (1, 2):
+        sys.exit("Usage: python game_log.py LOG [GAME_ID]")
+    if len(argv) == 2:
+        game = replay_game(argv[0], int(argv[1], 16))
+        print(f"Game {game.seed:016x}: scores {game.scores}, racks {game.racks}, "
+              f"{game.plays} plays, {game.skips} skips, {game.remaining_tiles} tiles left"
+              f"{'' if game.finished else ' (unfinished)'}")
+        return
+
+    start = time.perf_counter()
+    games = unfinished = 0
+    for game in replay(read_events(argv[0])):
+        games += 1
+        unfinished += not game.finished
+        if games % 100000 == 0:
+            print(f"Replayed {games} games...", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    print(f"Replayed {games} games ({unfinished} unfinished) in {elapsed:.1f} s; all matched their logs.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,273 @@
+import argparse
+import asyncio
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+
+from game_session import GameSession
+from rack import RACK_SIZE
+from rulesets import default_ruleset, get_ruleset, ruleset_names
+from scrabble_core import ScrabbleGame
+import snapshot
+
+# Protocol: one JSON object per line each way. Requests carry an "op":
+#   create {"players": 2, "max_turns": 10}  -> seat 0 at a new table
+#   join   {"table": id}                    -> next free seat at that table
+#   state, hint, play {"word": ...}, skip, leave
+#   rulesets; switch {"ruleset": name} sets the ruleset for new tables, and
+#   reload {"ruleset": name} re-reads its word list. create also takes "ruleset".
+# Every response has "ok" plus either the request's result or "error".
+
+
+class Table:
+    __slots__ = ('id', 'session', 'seats', 'busy')
+
+    def __init__(self, table_id, session):
+        self.id = table_id
+        self.session = session
+        self.seats = [False] * len(session.players)
+        self.busy = False
+
+
+class Connection:
+    __slots__ = ('table', 'seat')
+
+    def __init__(self):
+        self.table = None
+        self.seat = None
+
+
+class GameServer:
+    """Hosts many independent game tables in one asyncio process.
+
+    Tables share their ruleset's lexicon and validator, or the validator and
+    word cache given here for every table. Remote dictionary checks and hints
+    run on a thread pool so they never stall the event loop.
+    """
+
+    def __init__(self, validator=None, word_cache=None, workers=8, ruleset=None):
+        self.validator = validator
+        if validator is not None and word_cache is None:
+            from word_cache import default_word_cache
+            word_cache = default_word_cache(validator)
+        self.word_cache = word_cache
+        self.ruleset = get_ruleset(ruleset) if ruleset else default_ruleset()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.tables = {}
+        self._table_ids = itertools.count(1)
+        self._server = None
+        self._clients = {}
+
+    async def start(self, host='127.0.0.1', port=8765):
+        await self._prepare(self.ruleset)
+        self._server = await asyncio.start_server(self.handle_client, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        self._server.close()
+        for writer in self._clients.values():
+            writer.close()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        await self._server.wait_closed()
+        self.executor.shutdown(wait=False)
+
+    async def handle_client(self, reader, writer):
+        connection = Connection()
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    handler = getattr(self, f"op_{request['op']}", None)
+                    if handler is None:
+                        raise ValueError(f"Unknown op {request['op']!r}.")
+                    response = await handler(connection, request)
+                    response['ok'] = response.get('ok', True)
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {'ok': False, 'error': str(e)}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._leave(connection)
+            self._clients.pop(task, None)
+            writer.close()
+
+    def checkpoint(self):
+        """Snapshot every live table; returns {table id: snapshot bytes}."""
+        return {table_id: snapshot.dumps(table.session) for table_id, table in self.tables.items()}
+
+    def restore(self, snapshots):
+        """Recreate tables from checkpoint(), with all seats open for players to rejoin."""
+        for table_id, data in snapshots.items():
+            session = snapshot.loads(data, self.validator, self.word_cache)
+            self.tables[table_id] = Table(table_id, session)
+        if self.tables:
+            self._table_ids = itertools.count(max(self.tables) + 1)
+
+    def _table(self, connection):
+        if connection.table is None:
+            raise ValueError("Create or join a table first.")
+        return connection.table
+
+    def _state(self, table, seat):
+        session = table.session
+        return {
+            'table': table.id,
+            'ruleset': session.game.ruleset.name,
+            'seat': seat,
+            'rack': session.players[seat].rack.signature(),
+            'scores': session.scores(),
+            'current_player': session.current_player,
+            'turn': session.turn_counter,
+            'max_turns': session.max_turns,
+            'remaining_tiles': session.game.remaining_tiles,
+            'waiting': not all(table.seats),
+            'over': session.over,
+            'winner': session.winner() if session.over else None,
+        }
+
+    def _check_turn(self, table, seat):
+        if table.session.over:
+            raise ValueError("The game is over.")
+        if not all(table.seats):
+            raise ValueError("Waiting for players to join.")
+        if table.session.current_player != seat:
+            raise ValueError("It is not your turn.")
+        if table.busy:
+            raise ValueError("A move is already being checked.")
+
+    def _leave(self, connection):
+        table = connection.table
+        if table is None:
+            return
+        table.seats[connection.seat] = False
+        connection.table = connection.seat = None
+        if not any(table.seats):
+            self.tables.pop(table.id, None)
+
+    async def _prepare(self, ruleset):
+        """Load the ruleset's validator off the event loop; the first use may compile its word list."""
+        if self.validator is None:
+            await asyncio.get_running_loop().run_in_executor(self.executor, attrgetter('validator'), ruleset)
+
+    async def op_create(self, connection, request):
+        ruleset = get_ruleset(request['ruleset']) if 'ruleset' in request else self.ruleset
+        players = int(request.get('players', 2))
+        max_turns = int(request.get('max_turns', 10))
+        # Check before building the game, so a rejected create logs nothing.
+        most_players = sum(ruleset.tile_distribution.values()) // RACK_SIZE
+        if not 1 <= players <= most_players:
+            raise ValueError(f"players must be between 1 and {most_players}.")
+        if max_turns < 1:
+            raise ValueError("max_turns must be positive.")
+        await self._prepare(ruleset)
+        self._leave(connection)
+        game = ScrabbleGame(validator=self.validator, word_cache=self.word_cache, ruleset=ruleset)
+        session = GameSession(game, players, max_turns)
+        table = Table(next(self._table_ids), session)
+        self.tables[table.id] = table
+        table.seats[0] = True
+        connection.table, connection.seat = table, 0
+        return self._state(table, 0)
+
+    async def op_join(self, connection, request):
+        table = self.tables.get(request['table'])
+        if table is None:
+            raise ValueError(f"No table {request['table']}.")
+        if all(table.seats):
+            raise ValueError(f"Table {table.id} is full.")
+        self._leave(connection)
+        seat = table.seats.index(False)
+        table.seats[seat] = True
+        connection.table, connection.seat = table, seat
+        return self._state(table, seat)
+
+    async def op_state(self, connection, request):
+        return self._state(self._table(connection), connection.seat)
+
+    async def op_hint(self, connection, request):
+        table = self._table(connection)
+        game = table.session.game
+        rack = table.session.players[connection.seat].rack.copy()
+        loop = asyncio.get_running_loop()
+        plays = await loop.run_in_executor(self.executor, game.best_plays, rack, int(request.get('limit', 5)))
+        return {'plays': plays}
+
+    async def op_play(self, connection, request):
+        table, seat = self._table(connection), connection.seat
+        self._check_turn(table, seat)
+        word = str(request['word']).strip().upper()
+        game = table.session.game
+        rack = table.session.players[seat].rack
+        if game.validator.remote:
+            table.busy = True
+            try:
+                loop = asyncio.get_running_loop()
+                is_valid, message = await loop.run_in_executor(self.executor, game.is_valid_word, word, rack.copy())
+            finally:
+                table.busy = False
+        else:
+            is_valid, message = game.is_valid_word(word, rack)
+        if not is_valid:
+            return {'ok': False, 'error': message}
+        score = table.session.accept_word(word)
+        return {'score': score, 'state': self._state(table, seat)}
+
+    async def op_skip(self, connection, request):
+        table, seat = self._table(connection), connection.seat
+        self._check_turn(table, seat)
+        table.session.skip()
+        return {'state': self._state(table, seat)}
+
+    async def op_leave(self, connection, request):
+        self._leave(connection)
+        return {}
+
+    async def op_rulesets(self, connection, request):
+        return {'rulesets': ruleset_names(), 'default': self.ruleset.name}
+
+    async def op_switch(self, connection, request):
+        ruleset = get_ruleset(request['ruleset'])
+        await self._prepare(ruleset)
+        self.ruleset = ruleset
+        return {'default': self.ruleset.name}
+
+    async def op_reload(self, connection, request):
+        # Tables already playing keep the lexicon they started with.
+        ruleset = get_ruleset(request.get('ruleset', self.ruleset.name))
+        await asyncio.get_running_loop().run_in_executor(self.executor, ruleset.reload)
+        return {'reloaded': ruleset.name}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the multi-table Scrabble server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--ruleset', default=None, choices=ruleset_names(), help="ruleset for new tables")
+    args = parser.parse_args()
+
+    async def serve():
+        server = GameServer(ruleset=args.ruleset)
+        host, port = await server.start(args.host, args.port)
+        print(f"Serving Scrabble tables on {host}:{port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
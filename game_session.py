@@ -0,0 +1,92 @@
+from metrics import timed
+from rack import RACK_SIZE, Rack
+
+
+class Player:
+    __slots__ = ('rack', 'score')
+
+    def __init__(self, rack, score=0):
+        self.rack = rack
+        self.score = score
+
+
+class GameSession:
+    """Turn-by-turn state of one game, without any I/O.
+
+    Follows the GUI's rules: players take turns playing a word or skipping
+    (which swaps their rack), and the game ends once max_turns turns have
+    passed or a player runs out of tiles with the bag empty.
+    """
+
+    def __init__(self, game, players=2, max_turns=10):
+        self.game = game
+        self.players = []
+        for player in range(players):
+            game.start_turn(player)
+            self.players.append(Player(Rack(game.draw_tiles(RACK_SIZE))))
+        game.start_turn(0)
+        self.current_player = 0
+        self.turn_counter = 0
+        self.max_turns = max_turns
+        self.over = False
+
+    @classmethod
+    def restore(cls, game, players, current_player, turn_counter, max_turns, over):
+        """Rebuild a session from saved state without drawing any tiles."""
+        session = cls.__new__(cls)
+        session.game = game
+        session.players = players
+        session.current_player = current_player
+        session.turn_counter = turn_counter
+        session.max_turns = max_turns
+        session.over = over
+        return session
+
+    @property
+    def current(self):
+        return self.players[self.current_player]
+
+    @timed('play')
+    def play(self, word):
+        """Play word for the current player; returns (is_valid, message, score)."""
+        if self.over:
+            return False, "The game is over.", 0
+        is_valid, message = self.game.is_valid_word(word, self.current.rack)
+        if not is_valid:
+            return False, message, 0
+        return True, message, self.accept_word(word)
+
+    def accept_word(self, word):
+        """Score an already validated word for the current player and pass the turn."""
+        player = self.current
+        score = self.game.play_word(word, player.rack)
+        player.score += score
+        self.next_turn()
+        return score
+
+    @timed('skip')
+    def skip(self):
+        """Swap the current player's tiles and pass the turn."""
+        if self.over:
+            return
+        self.current.rack.exchange(self.game)
+        self.next_turn()
+
+    @timed('next_turn')
+    def next_turn(self):
+        self.turn_counter += 1
+        if self.turn_counter > self.max_turns or (not self.current.rack and self.game.remaining_tiles == 0):
+            self.over = True
+            self.game.finish(self.scores())
+            return
+        self.current_player = (self.current_player + 1) % len(self.players)
+        self.game.start_turn(self.current_player)
+
+    def scores(self):
+        return [player.score for player in self.players]
+
+    def winner(self):
+        """Index of the winning player, or None for a tie."""
+        scores = self.scores()
+        best = max(scores)
+        return scores.index(best) if scores.count(best) == 1 else None
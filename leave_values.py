@@ -0,0 +1,208 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations_with_replacement
+from math import comb
+
+from lexicon import WORD_LIST_PATH
+from rack import BLANK, LETTERS, Rack
+
+LEAVE_VALUES_PATH = os.environ.get(
+    'SCRABBLE_LEAVES',
+    os.path.splitext(WORD_LIST_PATH)[0] + '.leaves'
+)
+MAX_LEAVE = 6
+
+# Every multiset of up to MAX_LEAVE letters has a dense index: multisets are
+# ordered by size, then by the combinatorial (colex) rank of their sorted
+# letters, shifted so that repeated letters become distinct. Multisets of k
+# letters from 26 number comb(25 + k, k), and OFFSETS[k] is where size k starts.
+OFFSETS = [sum(comb(25 + j, j) for j in range(k)) for k in range(MAX_LEAVE + 2)]
+LEAVE_COUNT = OFFSETS[MAX_LEAVE + 1]
+
+# Saved table layout: a 16 byte header (magic, version, max leave size,
+# entry count) followed by one little-endian float32 per leave index.
+MAGIC = b'LEAV'
+VERSION = 1
+HEADER = struct.Struct('<4sIII')
+
+
+def leave_index(tiles):
+    """Dense index of the letters in tiles (blanks are ignored)."""
+    letters = sorted(ord(tile) - 65 for tile in tiles if tile != BLANK)
+    if len(letters) > MAX_LEAVE:
+        raise ValueError(f"Leaves have at most {MAX_LEAVE} tiles.")
+    index = OFFSETS[len(letters)]
+    for i, letter in enumerate(letters):
+        index += comb(letter + i, i + 1)
+    return index
+
+
+class LeaveValues:
+    """Leave value table read in place from a memory-mapped file.
+
+    A leave's value is how many more points a player scores on their next
+    turn by keeping those tiles than by drawing as many random ones.
+    """
+
+    def __init__(self, path=LEAVE_VALUES_PATH):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_leave, count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION or max_leave != MAX_LEAVE or count != LEAVE_COUNT:
+            raise ValueError(f"{path} is not a leave value table.")
+        values = memoryview(self._mmap)[HEADER.size:HEADER.size + 4 * count]
+        if sys.byteorder == 'little':
+            self._values = values.cast('f')
+        else:
+            self._values = array('f', values)
+            self._values.byteswap()
+
+    def __getitem__(self, tiles):
+        return self._values[leave_index(tiles)]
+
+    def __len__(self):
+        return len(self._values)
+
+
+def save_values(values, path):
+    values = array('f', values)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, MAX_LEAVE, len(values)))
+        values.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def rank_plays(game, rack, leaves, limit=10):
+    """List (word, score) plays ordered by score plus the value of the tiles they keep."""
+    rack = rack if isinstance(rack, Rack) else Rack(rack)
+    ranked = []
+    for word, score in game.best_plays(rack, limit=None):
+        leave = rack.copy()
+        leave.consume(word)
+        ranked.append((score + (leaves[leave] if len(leave) <= MAX_LEAVE else 0), word, score))
+    ranked.sort(key=lambda play: (-play[0], play[1]))
+    return [(word, score) for _, word, score in ranked[:limit]]
+
+
+_default_leaves = None
+
+
+def load_default_leave_values():
+    """Map the table at LEAVE_VALUES_PATH once per process, or None if there is none."""
+    global _default_leaves
+    if _default_leaves is None and os.path.exists(LEAVE_VALUES_PATH):
+        try:
+            _default_leaves = LeaveValues(LEAVE_VALUES_PATH)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not load leave values: {e}")
+    return _default_leaves
+
+
+class _LeaveRecorder:
+    """Self-play strategy that records what each kept leave scored on the next turn."""
+
+    def __init__(self, observations):
+        self.observations = observations
+        self.last_leave = None
+
+    def __call__(self, game, rack, rng):
+        plays = game.best_plays(rack, limit=5)
+        if self.last_leave is not None:
+            count, total = self.observations.get(self.last_leave, (0, 0))
+            self.observations[self.last_leave] = (count + 1, total + (plays[0][1] if plays else 0))
+        if not plays:
+            self.last_leave = None
+            return None
+        # Mostly greedy, sometimes not, so more kinds of leave get seen.
+        word = plays[0][0] if rng.random() < 0.8 else rng.choice(plays)[0]
+        leave = rack.copy()
+        leave.consume(word)
+        self.last_leave = leave_index(leave) if len(leave) <= MAX_LEAVE else None
+        return word
+
+
+def _self_play(seeds, max_turns):
+    from simulation import play_game
+    observations = {}
+    for seed in seeds:
+        play_game(seed, (_LeaveRecorder(observations), _LeaveRecorder(observations)), max_turns)
+    return observations
+
+
+def collect_observations(games, seed=0, max_turns=10, workers=None, batch_size=50):
+    """Self-play games on a process pool; returns {leave index: (count, total next score)}."""
+    observations = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_self_play, range(start, min(start + batch_size, seed + games)), max_turns)
+            for start in range(seed, seed + games, batch_size)
+        ]
+        for future in as_completed(futures):
+            for index, (count, total) in future.result().items():
+                old_count, old_total = observations.get(index, (0, 0))
+                observations[index] = (old_count + count, old_total + total)
+    return observations
+
+
+def estimate_values(observations, smoothing=20):
+    """Turn observations into a value for every leave index.
+
+    A leave's value is its average next-turn score above the average for
+    leaves of the same size, so keeping tiles is compared with drawing
+    random ones instead. It is shrunk towards a prior: zero for single
+    letters, and for larger leaves the average over its letters of (value
+    without the letter + that letter's value). Leaves never seen get the
+    prior alone.
+    """
+    totals = [[0, 0] for _ in range(MAX_LEAVE + 1)]
+    for index, (count, total) in observations.items():
+        size = bisect_right(OFFSETS, index) - 1
+        totals[size][0] += count
+        totals[size][1] += total
+    baselines = [total / count if count else 0.0 for count, total in totals]
+
+    values = array('f', bytes(4 * LEAVE_COUNT))
+    for size in range(1, MAX_LEAVE + 1):
+        for letters in combinations_with_replacement(LETTERS, size):
+            prior = 0.0
+            if size > 1:
+                parts = []
+                for letter in set(letters):
+                    i = letters.index(letter)
+                    parts.append(values[leave_index(letters[:i] + letters[i + 1:])] + values[leave_index(letter)])
+                prior = sum(parts) / len(parts)
+            index = leave_index(letters)
+            seen, total = observations.get(index, (0, 0))
+            values[index] = (total - seen * baselines[size] + smoothing * prior) / (seen + smoothing)
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Learn rack leave values from self-play.")
+    parser.add_argument('--games', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-turns', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--smoothing', type=float, default=20, help="pseudo-observations given to the prior")
+    parser.add_argument('--output', default=LEAVE_VALUES_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    observations = collect_observations(args.games, args.seed, args.max_turns, args.workers)
+    print(f"Observed {len(observations)} distinct leaves in {time.perf_counter() - start:.1f} s")
+    save_values(estimate_values(observations, args.smoothing), args.output)
+    print(f"Wrote {LEAVE_COUNT} leave values to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+WORD_LIST_PATH = os.environ.get(
+    'SCRABBLE_WORD_LIST',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'words.txt')
+)
+COMPILED_LEXICON_PATH = os.environ.get(
+    'SCRABBLE_LEXICON',
+    os.path.splitext(WORD_LIST_PATH)[0] + '.dawg'
+)
+
+# Compiled lexicon layout: a 16 byte header (magic, version, edge count,
+# word count) followed by little-endian uint32 edges. Each node is a run of
+# edges sorted by letter; an edge packs the letter (bits 0-4), whether the
+# target node ends a word (bit 5), whether it is the node's last edge
+# (bit 6) and the index of the target node's first edge (bits 7-31, 0 when
+# the target has no edges). Edge 0 is unused and the root starts at edge 1.
+MAGIC = b'DAWG'
+VERSION = 1
+HEADER = struct.Struct('<4sIII')
+ROOT = 1
+
+
+class _Node:
+    __slots__ = ('children', 'final')
+
+    def __init__(self):
+        self.children = {}
+        self.final = False
+
+    def signature(self):
+        return (self.final, tuple((letter, id(child)) for letter, child in self.children.items()))
+
+
+class Lexicon:
+    """Word list compiled into a DAWG (a trie with shared suffixes)."""
+
+    def __init__(self, words=()):
+        self.root = _Node()
+        self.word_count = 0
+        self._register = {}
+        self._previous = ''
+        self._unchecked = []
+        for word in sorted({w.strip().upper() for w in words if w.strip()}):
+            self._insert(word)
+        self._minimize(0)
+        self._register = None
+
+    @classmethod
+    def from_file(cls, path=WORD_LIST_PATH):
+        """Build a lexicon from a plain word list, one word per line."""
+        with open(path, encoding='utf-8') as f:
+            return cls(line for line in f if line.strip().isascii() and line.strip().isalpha())
+
+    def _insert(self, word):
+        # Words arrive in sorted order, so every node below the common prefix
+        # with the previous word is finished and can be merged with an equal one.
+        common = 0
+        for a, b in zip(word, self._previous):
+            if a != b:
+                break
+            common += 1
+        self._minimize(common)
+
+        node = self._unchecked[-1][2] if self._unchecked else self.root
+        for letter in word[common:]:
+            child = _Node()
+            node.children[letter] = child
+            self._unchecked.append((node, letter, child))
+            node = child
+        node.final = True
+        self._previous = word
+        self.word_count += 1
+
+    def _minimize(self, depth):
+        while len(self._unchecked) > depth:
+            parent, letter, child = self._unchecked.pop()
+            key = child.signature()
+            if key in self._register:
+                parent.children[letter] = self._register[key]
+            else:
+                self._register[key] = child
+
+    def _find(self, prefix):
+        node = self.root
+        for letter in prefix.upper():
+            node = node.children.get(letter)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, word):
+        node = self._find(word)
+        return node is not None and node.final
+
+    def has_prefix(self, prefix):
+        """Check if any word in the lexicon starts with prefix."""
+        return self._find(prefix) is not None
+
+    def __len__(self):
+        return self.word_count
+
+    def __iter__(self):
+        stack = [(self.root, '')]
+        while stack:
+            node, prefix = stack.pop()
+            if node.final:
+                yield prefix
+            for letter in sorted(node.children, reverse=True):
+                stack.append((node.children[letter], prefix + letter))
+
+    def save(self, path):
+        """Write the lexicon in the compiled format read by MappedLexicon."""
+        starts = {}
+        order = []
+        queue = [self.root]
+        position = ROOT
+        while queue:
+            node = queue.pop()
+            starts[id(node)] = position
+            order.append(node)
+            position += len(node.children)
+            for child in node.children.values():
+                if child.children and id(child) not in starts:
+                    starts[id(child)] = None
+                    queue.append(child)
+        if position >= 1 << 25:
+            raise ValueError("Lexicon is too large for the compiled format.")
+
+        edges = array('I', [0])
+        for node in order:
+            letters = sorted(node.children)
+            for i, letter in enumerate(letters):
+                child = node.children[letter]
+                edges.append(
+                    starts.get(id(child), 0) << 7
+                    | (i == len(letters) - 1) << 6
+                    | child.final << 5
+                    | ord(letter) - ord('A')
+                )
+        if sys.byteorder != 'little':
+            edges.byteswap()
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(edges), self.word_count))
+            edges.tofile(f)
+        os.replace(tmp_path, path)
+
+
+class MappedLexicon:
+    """Compiled lexicon walked in place from a memory-mapped file."""
+
+    def __init__(self, path=COMPILED_LEXICON_PATH):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, edge_count, self.word_count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a compiled lexicon.")
+        self._root = ROOT if edge_count > ROOT else 0
+        edges = memoryview(self._mmap)[HEADER.size:HEADER.size + 4 * edge_count]
+        if sys.byteorder == 'little':
+            self._edges = edges.cast('I')
+        else:
+            self._edges = array('I', edges)
+            self._edges.byteswap()
+
+    def _find(self, prefix):
+        edges = self._edges
+        position = self._root
+        final = False
+        for letter in prefix.upper():
+            index = ord(letter) - 65
+            if not position or not 0 <= index < 26:
+                return None
+            while True:
+                edge = edges[position]
+                if edge & 31 == index:
+                    break
+                if edge & 64 or edge & 31 > index:
+                    return None
+                position += 1
+            final = bool(edge & 32)
+            position = edge >> 7
+        return position, final
+
+    def __contains__(self, word):
+        node = self._find(word)
+        return node is not None and node[1]
+
+    def has_prefix(self, prefix):
+        """Check if any word in the lexicon starts with prefix."""
+        return self._find(prefix) is not None
+
+    def __len__(self):
+        return self.word_count
+
+    def __iter__(self):
+        edges = self._edges
+        stack = [(self._root, '', False)]
+        while stack:
+            position, prefix, final = stack.pop()
+            if final:
+                yield prefix
+            children = []
+            while position:
+                edge = edges[position]
+                children.append((edge >> 7, prefix + chr(65 + (edge & 31)), bool(edge & 32)))
+                if edge & 64:
+                    break
+                position += 1
+            stack.extend(reversed(children))
+
+
+def compile_word_list(word_list_path=WORD_LIST_PATH, lexicon_path=COMPILED_LEXICON_PATH):
+    """Compile a plain word list into the memory-mappable lexicon format."""
+    lexicon = Lexicon.from_file(word_list_path)
+    lexicon.save(lexicon_path)
+    return lexicon
+
+
+_lexicons = {}
+
+
+def load_lexicon(word_list_path, lexicon_path, reload=False):
+    """Map a compiled lexicon once per process, or None if there is no word list.
+
+    The compiled file is (re)built from word_list_path when it is missing or
+    older than the word list. reload=True maps it afresh, picking up a changed
+    word list; games still holding the old lexicon keep using it.
+    """
+    if not reload and lexicon_path in _lexicons:
+        return _lexicons[lexicon_path]
+
+    has_word_list = os.path.exists(word_list_path)
+    is_stale = has_word_list and (
+        not os.path.exists(lexicon_path)
+        or os.path.getmtime(lexicon_path) < os.path.getmtime(word_list_path)
+    )
+    lexicon = None
+    if is_stale:
+        try:
+            compile_word_list(word_list_path, lexicon_path)
+        except OSError as e:
+            print(f"Warning: Could not compile lexicon, loading word list instead: {e}")
+            lexicon = Lexicon.from_file(word_list_path)
+    if lexicon is None and os.path.exists(lexicon_path):
+        lexicon = MappedLexicon(lexicon_path)
+    if lexicon is not None:
+        _lexicons[lexicon_path] = lexicon
+    return lexicon
+
+
+def load_default_lexicon():
+    """The lexicon for WORD_LIST_PATH, mapped once per process, or None if there is none."""
+    return load_lexicon(WORD_LIST_PATH, COMPILED_LEXICON_PATH)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (1, 3):
+        sys.exit("Usage: python lexicon.py [WORD_LIST LEXICON_FILE]")
+    source, target = sys.argv[1:] or (WORD_LIST_PATH, COMPILED_LEXICON_PATH)
+    compiled = compile_word_list(source, target)
+    print(f"Compiled {len(compiled)} words into {target}")
@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from game_server import GameServer
+
+
+class Client:
+    """Simulated player speaking the server's JSON line protocol."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.latencies = []
+
+    @classmethod
+    async def connect(cls, host, port):
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(self, op, **fields):
+        start = time.perf_counter()
+        self.writer.write(json.dumps({'op': op, **fields}).encode() + b'\n')
+        await self.writer.drain()
+        response = json.loads(await self.reader.readline())
+        self.latencies.append(time.perf_counter() - start)
+        return response
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play_table(host, port, max_turns, think_time):
+    """Seat two clients at a new table and play greedily until the game ends."""
+    clients = [await Client.connect(host, port), await Client.connect(host, port)]
+    state = await clients[0].request('create', max_turns=max_turns)
+    await clients[1].request('join', table=state['table'])
+    while not state.get('over'):
+        client = clients[state['current_player']]
+        plays = (await client.request('hint', limit=1))['plays']
+        response = await client.request('play', word=plays[0][0]) if plays else {'ok': False}
+        if not response['ok']:
+            response = await client.request('skip')
+        state = response['state']
+        if think_time:
+            await asyncio.sleep(think_time)
+    for client in clients:
+        await client.close()
+    return [latency for client in clients for latency in client.latencies]
+
+
+async def run(clients, host, port, max_turns, think_time):
+    server = None
+    if port is None:
+        server = GameServer()
+        host, port = await server.start(host, 0)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(play_table(host, port, max_turns, think_time) for _ in range(clients // 2)),
+        return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+    if server:
+        await server.stop()
+
+    errors = [result for result in results if isinstance(result, BaseException)]
+    latencies = sorted(latency for result in results if not isinstance(result, BaseException) for latency in result)
+    print(f"Clients: {clients}  Games: {len(results) - len(errors)}  Errors: {len(errors)}")
+    if errors:
+        print(f"First error: {errors[0]!r}")
+    if latencies:
+        print(f"Requests: {len(latencies)} in {elapsed:.1f} s ({len(latencies) / elapsed:.0f}/s)")
+        print(f"Latency ms: p50 {latencies[len(latencies) // 2] * 1000:.1f}  "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f}  "
+              f"mean {statistics.fmean(latencies) * 1000:.1f}")
+
+
+def raise_file_limit():
+    # Each simulated client needs a socket on both ends.
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    try:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive many simulated clients against the game server.")
+    parser.add_argument('--clients', type=int, default=2000)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=None, help="server to test (default: start one in-process)")
+    parser.add_argument('--max-turns', type=int, default=10)
+    parser.add_argument('--think-time', type=float, default=0.0, help="seconds each client waits between moves")
+    args = parser.parse_args()
+
+    raise_file_limit()
+    asyncio.run(run(args.clients, args.host, args.port, args.max_turns, args.think_time))
+
+
+if __name__ == "__main__":
+    main()
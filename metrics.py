@@ -0,0 +1,136 @@
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+BUCKETS_MS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    __slots__ = ('counts', 'count', 'total')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(BUCKETS_MS, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def as_dict(self):
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(BUCKETS_MS + ('+Inf',), self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            'count': self.count,
+            'sum_ms': self.total,
+            'mean_ms': self.total / self.count if self.count else 0.0,
+            'buckets': buckets,
+        }
+
+
+class Metrics:
+    """Latency histograms and event counters for the game.
+
+    Disabled by default, in which case instrumented code only pays for one
+    attribute check. Set SCRABBLE_METRICS=1 (and optionally
+    SCRABBLE_METRICS_FILE) or call enable() to start recording.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def enable(self, path=None):
+        """Start recording; if path is given, write a snapshot there at exit."""
+        self.enabled = True
+        if path:
+            atexit.register(self.dump, path)
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+            self.counters = {}
+
+    def observe(self, name, milliseconds):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(milliseconds)
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def snapshot(self):
+        """Return all histograms and counters, plus the word cache hit ratio."""
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = {name: histogram.as_dict() for name, histogram in self.histograms.items()}
+        lookups = counters.get('word_cache_hits', 0) + counters.get('word_cache_misses', 0)
+        return {
+            'timestamp': time.time(),
+            'latency_ms': histograms,
+            'counters': counters,
+            'word_cache_hit_ratio': counters.get('word_cache_hits', 0) / lookups if lookups else None,
+        }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """Return the snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = ['# TYPE scrabble_latency_ms histogram']
+        for name, histogram in sorted(snapshot['latency_ms'].items()):
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'scrabble_latency_ms_bucket{{operation="{name}",le="{bound}"}} {count}')
+            lines.append(f'scrabble_latency_ms_sum{{operation="{name}"}} {histogram["sum_ms"]}')
+            lines.append(f'scrabble_latency_ms_count{{operation="{name}"}} {histogram["count"]}')
+        lines.append('# TYPE scrabble_events_total counter')
+        for name, count in sorted(snapshot['counters'].items()):
+            lines.append(f'scrabble_events_total{{event="{name}"}} {count}')
+        if snapshot['word_cache_hit_ratio'] is not None:
+            lines.append('# TYPE scrabble_word_cache_hit_ratio gauge')
+            lines.append(f"scrabble_word_cache_hit_ratio {snapshot['word_cache_hit_ratio']}")
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """Write a snapshot to path, in Prometheus format if it ends in .prom."""
+        with open(path, 'w') as f:
+            f.write(self.to_prometheus() if path.endswith('.prom') else self.to_json())
+
+
+METRICS = Metrics()
+if os.environ.get('SCRABBLE_METRICS'):
+    METRICS.enable(os.environ.get('SCRABBLE_METRICS_FILE'))
+
+
+def timed(name):
+    """Record how long each call of the decorated function takes under name."""
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                METRICS.observe(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
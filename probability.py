@@ -0,0 +1,144 @@
+import weakref
+from collections import Counter
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+
+from rack import BLANK, LETTERS, RACK_SIZE
+from word_finder import word_finder_for
+
+TILES = LETTERS + BLANK
+
+
+def pool_counts(tiles):
+    """Counts of each tile in TILES order, from a dict of counts or an iterable of tiles.
+
+    The tuple is hashable, so it doubles as the cache key for a bag state.
+    """
+    if isinstance(tiles, tuple) and len(tiles) == len(TILES):
+        return tiles
+    if isinstance(tiles, dict):
+        return tuple(tiles.get(tile, 0) for tile in TILES)
+    counts = [0] * len(TILES)
+    for tile in tiles:
+        counts[26 if tile == BLANK else ord(tile) - 65] += 1
+    return tuple(counts)
+
+
+def unseen_tiles(game, *other_racks):
+    """Tiles a player cannot see: the bag plus the other players' racks."""
+    tiles = [letter for letter, count in game.tile_bag.items() for _ in range(count)]
+    for rack in other_racks:
+        tiles.extend(rack)
+    return tiles
+
+
+def _count(counts, tile):
+    return counts[26 if tile == BLANK else ord(tile) - 65]
+
+
+@lru_cache(maxsize=65536)
+def _draw_probability(counts, tiles, draws):
+    total = sum(counts)
+    draws = min(draws, total)
+    # ways[k]: ways to draw k tiles of the wanted kinds, with enough of each.
+    ways = [1]
+    others = total
+    for tile, wanted in Counter(tiles).items():
+        available = _count(counts, tile)
+        if wanted > min(available, draws):
+            return 0.0
+        others -= available
+        factor = [comb(available, k) if k >= wanted else 0 for k in range(min(available, draws) + 1)]
+        product = [0] * min(len(ways) + len(factor) - 1, draws + 1)
+        for i, a in enumerate(ways):
+            for j, b in enumerate(factor[:len(product) - i]):
+                product[i + j] += a * b
+        ways = product
+    return sum(w * comb(others, draws - k) for k, w in enumerate(ways)) / comb(total, draws)
+
+
+def draw_probability(pool, tiles, draws):
+    """Exact chance that draws tiles taken from pool include every tile in tiles.
+
+    pool is a dict of counts or an iterable of tiles. Results are memoized
+    by pool state, so repeated queries during a turn are a cache lookup.
+    """
+    return _draw_probability(pool_counts(pool), ''.join(sorted(tiles)), draws)
+
+
+def _without(signature, letters):
+    # signature less letters, or None if it does not contain them all.
+    for letter in letters:
+        i = signature.find(letter)
+        if i < 0:
+            return None
+        signature = signature[:i] + signature[i + 1:]
+    return signature
+
+
+class BingoOdds:
+    """Chance that a leave refills to a rack that plays all seven tiles as one word.
+
+    Seven letter words are indexed by their sorted letters (signatures), and
+    by each letter they contain, so a leave is only compared with the
+    signatures holding its rarest letter. Results are kept in an LRU cache
+    keyed by pool state and leave.
+    """
+
+    def __init__(self, signatures, cache_size=4096):
+        self.signatures = tuple(signatures)
+        self.by_letter = {letter: [] for letter in LETTERS}
+        for signature in self.signatures:
+            for letter in set(signature):
+                self.by_letter[letter].append(signature)
+        self.probability = lru_cache(maxsize=cache_size)(self._probability)
+
+    def _probability(self, counts, leave):
+        """Chance for pool counts and a leave signature (letters sorted, blanks last)."""
+        letters = leave.replace(BLANK, '')
+        draws = RACK_SIZE - len(leave)
+        total = sum(counts)
+        if draws > total:
+            return 0.0
+        candidates = min((self.by_letter[letter] for letter in set(letters)), key=len) if letters else self.signatures
+        pool_blanks = counts[26]
+        # Each distinct set of drawn tiles is counted once, however many words it makes.
+        outcomes = set()
+        for signature in candidates:
+            needed = _without(signature, letters)
+            if needed is None:
+                continue
+            # The leave's blanks and any drawn blanks stand in for the rest of needed.
+            for blanks in range(min(pool_blanks, draws) + 1):
+                for drawn in combinations(needed, draws - blanks):
+                    outcomes.add((drawn, blanks))
+        ways = 0
+        for drawn, blanks in outcomes:
+            count = comb(pool_blanks, blanks)
+            for letter, k in Counter(drawn).items():
+                count *= comb(counts[ord(letter) - 65], k)
+            ways += count
+        return ways / comb(total, draws)
+
+
+# Weak keys, like the word finders, so a reloaded lexicon's table goes with it.
+_bingo_odds = weakref.WeakKeyDictionary()
+
+
+def bingo_odds_for(lexicon):
+    """Build the bingo table for a lexicon once per process and share it."""
+    odds = _bingo_odds.get(lexicon)
+    if odds is None:
+        signatures = (signature for signature in word_finder_for(lexicon).index if len(signature) == RACK_SIZE)
+        odds = _bingo_odds[lexicon] = BingoOdds(signatures)
+    return odds
+
+
+def bingo_probability(lexicon, pool, leave):
+    """Exact chance that leave, refilled to RACK_SIZE tiles from pool, holds a seven letter word."""
+    leave = list(leave)
+    if len(leave) > RACK_SIZE:
+        raise ValueError(f"A leave has at most {RACK_SIZE} tiles.")
+    signature = ''.join(sorted(tile for tile in leave if tile != BLANK)) + BLANK * leave.count(BLANK)
+    return bingo_odds_for(lexicon).probability(pool_counts(pool), signature)
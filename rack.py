@@ -0,0 +1,116 @@
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+BLANK = '?'
+RACK_SIZE = 7
+
+
+class Rack:
+    """A player's tiles stored as 26 letter counts plus a count of blanks.
+
+    Blanks ('?') stand in for any letter the rack is short of.
+    """
+
+    __slots__ = ('counts', 'blanks', 'size')
+
+    def __init__(self, tiles=()):
+        self.counts = [0] * 26
+        self.blanks = 0
+        self.size = 0
+        self.add(tiles)
+
+    def add(self, tiles):
+        """Put tiles on the rack."""
+        for tile in tiles:
+            if tile == BLANK:
+                self.blanks += 1
+            else:
+                self.counts[ord(tile) - 65] += 1
+            self.size += 1
+
+    def remove(self, tiles):
+        """Take tiles off the rack, blanks included."""
+        for tile in tiles:
+            if tile == BLANK:
+                self.blanks -= 1
+            else:
+                self.counts[ord(tile) - 65] -= 1
+            self.size -= 1
+
+    def can_form(self, word):
+        """Check if word (upper case) can be made from the tiles on the rack."""
+        counts = self.counts
+        missing = 0
+        checked = 0
+        for letter in word:
+            i = ord(letter) - 65
+            if not 0 <= i < 26:
+                missing = self.blanks + 1
+                break
+            counts[i] -= 1
+            checked += 1
+            if counts[i] < 0:
+                missing += 1
+        # Undo the trial removal instead of copying the counts.
+        for j in range(checked):
+            counts[ord(word[j]) - 65] += 1
+        return missing <= self.blanks
+
+    def consume(self, word):
+        """Remove the tiles for word and return the letters played with blanks."""
+        if not self.can_form(word):
+            raise ValueError(f"Cannot form {word} with tiles {self}.")
+        counts = self.counts
+        blank_letters = ''
+        for letter in word:
+            i = ord(letter) - 65
+            if counts[i]:
+                counts[i] -= 1
+            else:
+                self.blanks -= 1
+                blank_letters += letter
+        self.size -= len(word)
+        return blank_letters
+
+    def refill(self, game, size=RACK_SIZE):
+        """Draw from the game's bag until the rack holds size tiles or the bag is empty."""
+        tiles_needed = min(size - self.size, game.remaining_tiles)
+        if tiles_needed > 0:
+            self.add(game.draw_tiles(tiles_needed))
+
+    def exchange(self, game):
+        """Swap every tile on the rack for new ones from the game's bag."""
+        self.add(game.exchange_tiles(self.clear()))
+
+    def clear(self):
+        """Empty the rack and return the tiles that were on it."""
+        tiles = list(self)
+        self.counts = [0] * 26
+        self.blanks = 0
+        self.size = 0
+        return tiles
+
+    def signature(self):
+        """Sorted letters on the rack, blanks last."""
+        return ''.join(self)
+
+    def copy(self):
+        rack = Rack()
+        rack.counts = self.counts[:]
+        rack.blanks = self.blanks
+        rack.size = self.size
+        return rack
+
+    def __iter__(self):
+        for i, count in enumerate(self.counts):
+            for _ in range(count):
+                yield LETTERS[i]
+        for _ in range(self.blanks):
+            yield BLANK
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return ' '.join(self)
+
+    def __repr__(self):
+        return f"Rack({''.join(self)!r})"
@@ -0,0 +1,129 @@
+import json
+import os
+import threading
+from types import MappingProxyType
+
+from lexicon import COMPILED_LEXICON_PATH, WORD_LIST_PATH, load_lexicon
+from rack import BLANK, LETTERS
+
+RULESETS_PATH = os.environ.get('SCRABBLE_RULESETS')
+DEFAULT_RULESET = os.environ.get('SCRABBLE_RULESET', 'english')
+
+# Read-only, so every English game shares these tables instead of copying them.
+TILE_DISTRIBUTION = MappingProxyType({
+    'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12,
+    'F': 2, 'G': 3, 'H': 2, 'I': 9, 'J': 1,
+    'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8,
+    'P': 2, 'Q': 1, 'R': 6, 'S': 4, 'T': 6,
+    'U': 4, 'V': 2, 'W': 2, 'X': 1, 'Y': 2, 'Z': 1
+})
+
+LETTER_SCORES = MappingProxyType({
+    'A': 1, 'B': 3, 'C': 3, 'D': 2, 'E': 1,
+    'F': 4, 'G': 2, 'H': 4, 'I': 1, 'J': 8,
+    'K': 5, 'L': 1, 'M': 3, 'N': 1, 'O': 1,
+    'P': 3, 'Q': 10, 'R': 1, 'S': 1, 'T': 1,
+    'U': 1, 'V': 4, 'W': 4, 'X': 8, 'Y': 4, 'Z': 10
+})
+
+
+def _read_only(table):
+    return table if isinstance(table, MappingProxyType) else MappingProxyType(dict(table))
+
+
+class Ruleset:
+    """A named word list with the tile distribution and letter scores played with it.
+
+    The lexicon is compiled and memory-mapped on first use, so worker
+    processes that load the same ruleset share its pages. Games keep the
+    validator they started with, so reload() only affects new games.
+    """
+
+    def __init__(self, name, word_list, tile_distribution, letter_scores, lexicon_path=None, api_fallback=False):
+        if not name.isascii() or len(name) > 16:
+            raise ValueError(f"Ruleset name {name!r} must be at most 16 ASCII characters.")
+        tiles = set(tile_distribution) | set(letter_scores)
+        if not tiles <= set(LETTERS + BLANK):
+            raise ValueError(f"Ruleset {name!r} uses tiles other than A-Z and {BLANK}: {sorted(tiles - set(LETTERS + BLANK))}")
+        self.name = name
+        self.word_list = word_list
+        self.lexicon_path = lexicon_path or os.path.splitext(word_list)[0] + '.dawg'
+        self.tile_distribution = _read_only(tile_distribution)
+        self.letter_scores = _read_only(letter_scores)
+        self.api_fallback = api_fallback
+        self._validator = None
+        self._lock = threading.Lock()
+
+    @property
+    def lexicon(self):
+        return load_lexicon(self.word_list, self.lexicon_path)
+
+    @property
+    def validator(self):
+        """Shared validator for the ruleset's lexicon, created on first use."""
+        if self._validator is None:
+            with self._lock:
+                if self._validator is None:
+                    self._validator = self._make_validator(self.lexicon)
+        return self._validator
+
+    def _make_validator(self, lexicon):
+        from validators import LexiconValidator, default_validator
+        if lexicon is not None:
+            return LexiconValidator(lexicon)
+        if self.api_fallback:
+            return default_validator()
+        raise ValueError(f"Ruleset {self.name!r} has no word list at {self.word_list}.")
+
+    def reload(self):
+        """Recompile the word list if it changed and map it afresh for new games."""
+        with self._lock:
+            self._validator = self._make_validator(load_lexicon(self.word_list, self.lexicon_path, reload=True))
+
+    def __repr__(self):
+        return f"Ruleset({self.name!r})"
+
+
+ENGLISH = Ruleset('english', WORD_LIST_PATH, TILE_DISTRIBUTION, LETTER_SCORES, COMPILED_LEXICON_PATH, api_fallback=True)
+RULESETS = {'english': ENGLISH}
+_loaded_file = False
+
+
+def _load_configured():
+    global _loaded_file
+    if not _loaded_file and RULESETS_PATH:
+        _loaded_file = True
+        load_rulesets(RULESETS_PATH)
+
+
+def load_rulesets(path):
+    """Register the rulesets described in a JSON file.
+
+    The file maps names to {"word_list": ..., "tiles": {...}, "scores": {...}};
+    word list paths are relative to the file.
+    """
+    with open(path, encoding='utf-8') as f:
+        bundles = json.load(f)
+    directory = os.path.dirname(os.path.abspath(path))
+    for name, bundle in bundles.items():
+        word_list = os.path.join(directory, bundle['word_list'])
+        RULESETS[name] = Ruleset(name, word_list, bundle['tiles'], bundle['scores'])
+
+
+def ruleset_names():
+    """Names of the built-in rulesets and those in SCRABBLE_RULESETS."""
+    _load_configured()
+    return sorted(RULESETS)
+
+
+def get_ruleset(name):
+    _load_configured()
+    try:
+        return RULESETS[name]
+    except KeyError:
+        raise ValueError(f"Unknown ruleset {name!r}.") from None
+
+
+def default_ruleset():
+    """The ruleset named by SCRABBLE_RULESET, English by default."""
+    return get_ruleset(DEFAULT_RULESET)
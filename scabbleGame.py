@@ -1,102 +1,5 @@
-import random
-from collections import Counter
-import requests
-import time
-
-class ScrabbleGame:
-    def __init__(self):
-        self.tile_bag = {
-            'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12,
-            'F': 2, 'G': 3, 'H': 2, 'I': 9, 'J': 1,
-            'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8,
-            'P': 2, 'Q': 1, 'R': 6, 'S': 4, 'T': 6,
-            'U': 4, 'V': 2, 'W': 2, 'X': 1, 'Y': 2, 'Z': 1
-        }
-        self.letter_scores = {
-            'A': 1, 'B': 3, 'C': 3, 'D': 2, 'E': 1,
-            'F': 4, 'G': 2, 'H': 4, 'I': 1, 'J': 8,
-            'K': 5, 'L': 1, 'M': 3, 'N': 1, 'O': 1,
-            'P': 3, 'Q': 10, 'R': 1, 'S': 1, 'T': 1,
-            'U': 1, 'V': 4, 'W': 4, 'X': 8, 'Y': 4, 'Z': 10
-        }
-        self.remaining_tiles = sum(self.tile_bag.values())
-        self.word_cache = {} 
-
-    def is_valid_dictionary_word(self, word):
-        """Check if the word exists in the dictionary using the Free Dictionary API."""
-        if word in self.word_cache:
-            return self.word_cache[word]
-
-        try:
-            url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word.lower()}"
-            response = requests.get(url)
-            
-            is_valid = response.status_code == 200
-            self.word_cache[word] = is_valid
-            
-            time.sleep(0.5)
-            
-            return is_valid
-        except requests.RequestException as e:
-            print(f"Warning: Could not verify word due to API error: {e}")
-            return True
-
-    def draw_tiles(self, count):
-        """Draw random tiles from the bag."""
-        if count > self.remaining_tiles:
-            raise ValueError(f"Not enough tiles in bag. Only {self.remaining_tiles} remaining.")
-        
-        tiles = []
-        while len(tiles) < count:
-            available_letters = []
-            for letter, freq in self.tile_bag.items():
-                if freq > 0:
-                    available_letters.extend([letter] * freq)
-            
-            if not available_letters:
-                break
-                
-            letter = random.choice(available_letters)
-            tiles.append(letter)
-            self.tile_bag[letter] -= 1
-            self.remaining_tiles -= 1
-            
-        return tiles
-
-    def return_tiles(self, tiles):
-        """Return tiles to the bag."""
-        for tile in tiles:
-            if tile in self.tile_bag:
-                self.tile_bag[tile] += 1
-                self.remaining_tiles += 1
-
-    def calculate_score(self, word):
-        """Calculate the score for a word."""
-        return sum(self.letter_scores.get(letter.upper(), 0) for letter in word)
-
-    def is_valid_word(self, word, player_tiles):
-        """Check if word can be formed from player's tiles and exists in dictionary."""
-        word_upper = word.upper()
-        
-        player_counter = Counter(player_tiles)
-        word_counter = Counter(word_upper)
-        
-        for letter, count in word_counter.items():
-            if count > player_counter.get(letter, 0):
-                return False, "Cannot form this word with your tiles!"
-
-        if not self.is_valid_dictionary_word(word):
-            return False, "Not a valid word in the dictionary!"
-            
-        return True, "Valid word!"
-
-    def replenish_tiles(self, player_tiles, used_tiles):
-        """Replenish player's tiles after playing a word."""
-        tiles_needed = min(7 - len(player_tiles), self.remaining_tiles)
-        if tiles_needed > 0:
-            new_tiles = self.draw_tiles(tiles_needed)
-            return player_tiles + new_tiles
-        return player_tiles
+from scrabble_core import ScrabbleGame
+from rack import Rack
 
 def main():
     game = ScrabbleGame()
@@ -109,48 +12,65 @@ def main():
     print("3. Enter 'QUIT' to end the game")
     print("4. Enter 'SKIP' to draw new tiles (counts as a turn)")
     print("5. Words will be verified using a dictionary")
-    print(f"6. Remaining tiles in bag: {game.remaining_tiles}\n")
+    print("6. Enter 'HINT' to see the best words for your tiles")
+    print("7. Enter 'ODDS <tiles> [count]' for the chance of drawing those tiles")
+    print(f"8. Remaining tiles in bag: {game.remaining_tiles}\n")
 
     try:
-        player_tiles = game.draw_tiles(7)
+        rack = Rack(game.draw_tiles(7))
         
         while True:
-            print(f"\nYour tiles: {' '.join(player_tiles)}")
+            print(f"\nYour tiles: {rack}")
             print(f"Current score: {player_score}")
             
-            word = input("\nEnter a word (or QUIT/SKIP): ").upper()
+            word = input("\nEnter a word (or QUIT/SKIP/HINT/ODDS): ").upper()
             
             if word == 'QUIT':
                 break
             
             if word == 'SKIP':
-                game.return_tiles(player_tiles)
-                player_tiles = game.draw_tiles(7)
+                rack.exchange(game)
+                continue
+
+            if word == 'HINT':
+                plays = game.best_plays(rack, limit=5)
+                if not plays:
+                    print("No hints available.")
+                for hint, hint_score in plays:
+                    leave = rack.copy()
+                    leave.consume(hint)
+                    print(f"  {hint}: {hint_score} points, "
+                          f"{game.bingo_probability(leave):.1%} chance the rest draws a bingo")
+                continue
+
+            if word.split()[:1] == ['ODDS']:
+                args = word.split()[1:]
+                tiles_ok = args and args[0].isascii() and args[0].replace('?', '').isalpha()
+                count_ok = len(args) < 2 or (args[1].isascii() and args[1].isdigit())
+                if not tiles_ok or not count_ok:
+                    print("Usage: ODDS <tiles> [count], e.g. ODDS U 3")
+                    continue
+                draws = int(args[1]) if len(args) > 1 else 7
+                chance = game.draw_probability(args[0], draws)
+                print(f"Chance of drawing {args[0]} in the next {draws} tiles: {chance:.1%}")
                 continue
             
             if not word.isalpha():
                 print("Please enter only letters.")
                 continue
                 
-            is_valid, message = game.is_valid_word(word, player_tiles)
+            is_valid, message = game.is_valid_word(word, rack)
             if not is_valid:
                 print(message)
                 continue
             
-            word_score = game.calculate_score(word)
+            word_score = game.play_word(word, rack)
             player_score += word_score
             
-            used_tiles = list(word.upper())
-            remaining_tiles = [t for t in player_tiles]
-            for letter in used_tiles:
-                remaining_tiles.remove(letter)
-            
-            player_tiles = game.replenish_tiles(remaining_tiles, used_tiles)
-            
             print(f"Word '{word}' scored {word_score} points!")
             print(f"Tiles remaining in bag: {game.remaining_tiles}")
             
-            if not player_tiles and game.remaining_tiles == 0:
+            if not rack and game.remaining_tiles == 0:
                 print("\nGame Over! No more tiles available.")
                 break
                 
@@ -159,6 +79,7 @@ def main():
     except Exception as e:
         print(f"\nAn error occurred: {e}")
     
+    game.finish([player_score])
     print(f"\nFinal score: {player_score}")
 
 
@@ -0,0 +1,175 @@
+from rulesets import default_ruleset, get_ruleset
+from tile_bag import TileBag
+from rack import Rack
+from word_finder import word_finder_for
+from metrics import METRICS, timed
+from probability import bingo_probability, draw_probability
+from game_log import default_event_log
+from word_cache import default_word_cache
+
+class ScrabbleGame:
+    # Rule tables live on the shared ruleset; a game only holds its own state.
+    __slots__ = ('ruleset', 'recorder', 'bag', 'validator', 'word_cache')
+
+    def __init__(self, validator=None, word_cache=None, rng=None, recorder=None, ruleset=None):
+        # A ruleset (or its name) supplies the tiles, scores and, unless one is given, the validator.
+        self.ruleset = get_ruleset(ruleset) if isinstance(ruleset, str) else ruleset or default_ruleset()
+        if recorder is None and rng is None:
+            # Games with their own RNG are already reproducible; only log the rest.
+            log = default_event_log()
+            recorder = log.start_game(ruleset=self.ruleset.name) if log else None
+        self.recorder = recorder
+        self.bag = TileBag(self.ruleset.tile_distribution, recorder.rng if rng is None and recorder else rng)
+        self.validator = validator or self.ruleset.validator
+        self.word_cache = default_word_cache(self.validator) if word_cache is None else word_cache
+
+    @property
+    def letter_scores(self):
+        return self.ruleset.letter_scores
+
+    @property
+    def tile_bag(self):
+        """Counts of each letter left in the bag."""
+        return self.bag.as_dict()
+
+    @property
+    def remaining_tiles(self):
+        return len(self.bag)
+
+    @timed('is_valid_dictionary_word')
+    def is_valid_dictionary_word(self, word):
+        """Check if the word exists in the dictionary using the game's validator.
+
+        Words the validator could not check are allowed.
+        """
+        is_valid = self.dictionary_verdict(word)
+        if is_valid is None:
+            if METRICS.enabled:
+                METRICS.increment('dictionary_unverified')
+            return True
+        return is_valid
+
+    def dictionary_verdict(self, word):
+        """Return whether word is in the dictionary, or None if it could not be checked."""
+        prefilter = self.validator.prefilter
+        if prefilter is not None and word not in prefilter:
+            if METRICS.enabled:
+                METRICS.increment('prefilter_rejects')
+            return False
+
+        is_valid = self.word_cache.get(word)
+        if is_valid is not None:
+            if METRICS.enabled:
+                METRICS.increment('word_cache_hits')
+            return is_valid
+
+        if METRICS.enabled:
+            METRICS.increment('word_cache_misses')
+        is_valid = self.lookup_word(word)
+        if is_valid is not None:
+            self.word_cache[word] = is_valid
+        return is_valid
+
+    @timed('dictionary_lookup')
+    def lookup_word(self, word):
+        """Ask the validator about a word, bypassing the cache."""
+        return self.validator.is_valid(word)
+
+    @timed('draw_tiles')
+    def draw_tiles(self, count):
+        """Draw random tiles from the bag."""
+        if count > self.remaining_tiles:
+            raise ValueError(f"Not enough tiles in bag. Only {self.remaining_tiles} remaining.")
+        tiles = self.bag.draw_many(count)
+        if self.recorder:
+            self.recorder.draw(tiles)
+        return tiles
+
+    def return_tiles(self, tiles):
+        """Return tiles to the bag."""
+        if self.recorder:
+            self.recorder.returned(tiles)
+        for tile in tiles:
+            if tile in self.bag:
+                self.bag.put_back(tile)
+
+    def exchange_tiles(self, tiles):
+        """Return tiles to the bag and draw the same number of new ones."""
+        if self.recorder:
+            self.recorder.skip()
+        self.return_tiles(tiles)
+        return self.draw_tiles(len(tiles))
+
+    def calculate_score(self, word, blank_letters=''):
+        """Calculate the score for a word, counting letters played with blanks as zero."""
+        letter_scores = self.ruleset.letter_scores
+        score = sum(letter_scores.get(letter.upper(), 0) for letter in word)
+        return score - sum(letter_scores.get(letter, 0) for letter in blank_letters)
+
+    @timed('is_valid_word')
+    def is_valid_word(self, word, player_tiles):
+        """Check if word can be formed from player's tiles and exists in dictionary."""
+        rack = player_tiles if isinstance(player_tiles, Rack) else Rack(player_tiles)
+        if not rack.can_form(word.upper()):
+            return False, "Cannot form this word with your tiles!"
+
+        if not self.is_valid_dictionary_word(word):
+            return False, "Not a valid word in the dictionary!"
+
+        return True, "Valid word!"
+
+    def replenish_tiles(self, rack):
+        """Replenish player's rack after playing a word."""
+        rack.refill(self)
+        return rack
+
+    def best_plays(self, rack, limit=10):
+        """List the highest scoring (word, score) plays the rack can make."""
+        lexicon = self.validator.lexicon
+        if lexicon is None:
+            return []
+        rack = rack if isinstance(rack, Rack) else Rack(rack)
+        plays = [
+            (word, self.calculate_score(word, blank_letters))
+            for word, blank_letters in word_finder_for(lexicon).find(rack.signature())
+        ]
+        plays.sort(key=lambda play: (-play[1], play[0]))
+        return plays[:limit]
+
+    def draw_probability(self, tiles, draws, unseen=None):
+        """Exact chance that the next draws tiles include all of tiles.
+
+        unseen is the pool drawn from, as tiles or counts; it defaults to the
+        bag, but a player who cannot see the other racks should pass
+        probability.unseen_tiles(game, *other_racks).
+        """
+        return draw_probability(self.tile_bag if unseen is None else unseen, tiles, draws)
+
+    def bingo_probability(self, leave, unseen=None):
+        """Exact chance that leave, refilled from unseen, can play all seven tiles as one word.
+
+        Returns None without a local lexicon to look words up in.
+        """
+        lexicon = self.validator.lexicon
+        if lexicon is None:
+            return None
+        return bingo_probability(lexicon, self.tile_bag if unseen is None else unseen, leave)
+
+    def play_word(self, word, rack):
+        """Take a validated word's tiles off the rack, refill it and return the score."""
+        word = word.upper()
+        score = self.calculate_score(word, rack.consume(word))
+        if self.recorder:
+            self.recorder.play(word, score)
+        self.replenish_tiles(rack)
+        return score
+
+    def start_turn(self, player):
+        """Note in the event log that player is now taking tiles and turns."""
+        if self.recorder:
+            self.recorder.turn(player)
+
+    def finish(self, scores):
+        """Note the final scores in the event log."""
+        if self.recorder:
+            self.recorder.end(scores)
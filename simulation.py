@@ -0,0 +1,128 @@
+import argparse
+import random
+import statistics
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from game_session import GameSession
+from scrabble_core import ScrabbleGame
+from validators import default_validator
+
+GameResult = namedtuple('GameResult', 'seed scores turns winner')
+
+
+def greedy_strategy(game, rack, rng):
+    """Play the highest scoring word, or skip if there is none."""
+    plays = game.best_plays(rack, limit=1)
+    return plays[0][0] if plays else None
+
+
+def random_strategy(game, rack, rng):
+    """Play any word the rack can make."""
+    plays = game.best_plays(rack, limit=None)
+    return rng.choice(plays)[0] if plays else None
+
+
+def leave_strategy(game, rack, rng):
+    """Play the word with the best score plus leave value, or greedily without a leave table."""
+    from leave_values import load_default_leave_values, rank_plays
+    leaves = load_default_leave_values()
+    if leaves is None:
+        return greedy_strategy(game, rack, rng)
+    plays = rank_plays(game, rack, leaves, limit=1)
+    return plays[0][0] if plays else None
+
+
+STRATEGIES = {
+    'greedy': greedy_strategy,
+    'leave': leave_strategy,
+    'random': random_strategy,
+}
+
+_validator = None
+
+
+def _local_validator():
+    global _validator
+    if _validator is None:
+        _validator = default_validator()
+        if _validator.lexicon is None:
+            raise RuntimeError("Simulations need a local word list (see lexicon.WORD_LIST_PATH).")
+    return _validator
+
+
+def play_game(seed, strategies=('greedy', 'greedy'), max_turns=10, validator=None):
+    """Play one game between strategies (names or callables) and return its GameResult.
+
+    A strategy is called as strategy(game, rack, rng) and returns a word to
+    play or None to skip. The same seed always gives the same game.
+    """
+    strategies = [STRATEGIES[s] if isinstance(s, str) else s for s in strategies]
+    game = ScrabbleGame(validator=validator or _local_validator(), rng=random.Random(seed))
+    strategy_rng = random.Random(f"{seed}:strategy")
+    session = GameSession(game, len(strategies), max_turns)
+    while not session.over:
+        word = strategies[session.current_player](game, session.current.rack, strategy_rng)
+        if word is None or not session.play(word)[0]:
+            session.skip()
+    return GameResult(seed, tuple(session.scores()), session.turn_counter, session.winner())
+
+
+def _play_games(seeds, strategies, max_turns):
+    return [play_game(seed, strategies, max_turns) for seed in seeds]
+
+
+def run_games(count, strategies=('greedy', 'greedy'), seed=0, max_turns=10, workers=None, batch_size=50):
+    """Play count games over a process pool, yielding results as batches finish.
+
+    Game i uses seed + i, so a run is reproducible whatever the worker count.
+    Strategies must be given by name or as module-level functions.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_play_games, range(start, min(start + batch_size, seed + count)), strategies, max_turns)
+            for start in range(seed, seed + count, batch_size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def summarize(results):
+    """Aggregate score distributions and wins over GameResults."""
+    results = list(results)
+    if not results:
+        return {'games': 0, 'ties': 0, 'players': []}
+    wins = Counter(result.winner for result in results)
+    players = []
+    for i in range(len(results[0].scores)):
+        scores = [result.scores[i] for result in results]
+        players.append({
+            'mean': statistics.fmean(scores),
+            'stdev': statistics.pstdev(scores),
+            'min': min(scores),
+            'max': max(scores),
+            'wins': wins[i],
+            'histogram': dict(sorted(Counter(score // 10 * 10 for score in scores).items())),
+        })
+    return {'games': len(results), 'ties': wins[None], 'players': players}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless Scrabble games between strategies.")
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--strategies', nargs='+', default=['greedy', 'greedy'], choices=sorted(STRATEGIES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-turns', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    results = run_games(args.games, args.strategies, args.seed, args.max_turns, args.workers)
+    summary = summarize(results)
+    print(f"Games: {summary['games']}  Ties: {summary['ties']}")
+    for i, (name, player) in enumerate(zip(args.strategies, summary['players']), 1):
+        print(f"Player {i} ({name}): mean {player['mean']:.1f}, stdev {player['stdev']:.1f}, "
+              f"min {player['min']}, max {player['max']}, wins {player['wins']}")
+
+
+if __name__ == "__main__":
+    main()
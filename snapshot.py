@@ -0,0 +1,97 @@
+import random
+import struct
+
+from game_log import GameRecorder, default_event_log
+from game_session import GameSession, Player
+from rack import BLANK, LETTERS, Rack
+from scrabble_core import ScrabbleGame
+
+# Layout, all little-endian and fixed size apart from the player count:
+#   header  magic, version, players, current player, turn, max turns, over,
+#           ruleset name, whether the game is in the event log and its id there
+#   bag     27 counts: A-Z then blanks
+#   player  27 rack counts (A-Z then blanks) and the score, once per player
+#   rng     the Mersenne Twister's 625 state words, then gauss_next
+MAGIC = b'SCRS'
+VERSION = 3
+HEADER = struct.Struct('<4sHBBHHB16s?Q')
+BAG = struct.Struct('<27B')
+PLAYER = struct.Struct('<27BI')
+RNG = struct.Struct('<625I?d')
+TILES = LETTERS + BLANK
+
+
+def dumps(session):
+    """Pack a game session into a compact binary snapshot."""
+    game = session.game
+    bag = game.bag
+    if bag.letters == tuple(LETTERS):
+        bag_counts = [*bag.counts, 0]
+    else:
+        bag_counts = [0] * len(TILES)
+        for letter, count in zip(bag.letters, bag.counts):
+            bag_counts[TILES.index(letter)] = count
+    version, words, gauss_next = bag.rng.getstate()
+    recorder = game.recorder
+    parts = [
+        HEADER.pack(MAGIC, VERSION, len(session.players), session.current_player,
+                    session.turn_counter, session.max_turns, session.over, game.ruleset.name.encode('ascii'),
+                    recorder is not None, recorder.seed if recorder else 0),
+        BAG.pack(*bag_counts),
+    ]
+    for player in session.players:
+        parts.append(PLAYER.pack(*player.rack.counts, player.rack.blanks, player.score))
+    parts.append(RNG.pack(*words, gauss_next is not None, gauss_next or 0.0))
+    return b''.join(parts)
+
+
+def loads(data, validator=None, word_cache=None):
+    """Rebuild the game session saved by dumps, sharing validator and word_cache.
+
+    A game that was in the event log carries on logging under its id, if
+    this process has an event log.
+    """
+    (magic, version, player_count, current_player, turn_counter, max_turns, over, ruleset,
+     recorded, game_id) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a game snapshot.")
+    if len(data) != HEADER.size + BAG.size + PLAYER.size * player_count + RNG.size:
+        raise ValueError("Game snapshot is truncated or corrupt.")
+    offset = HEADER.size
+
+    bag_counts = BAG.unpack_from(data, offset)
+    offset += BAG.size
+    players = []
+    for _ in range(player_count):
+        fields = PLAYER.unpack_from(data, offset)
+        offset += PLAYER.size
+        rack = Rack()
+        rack.counts = list(fields[:26])
+        rack.blanks = fields[26]
+        rack.size = sum(fields[:27])
+        players.append(Player(rack, fields[27]))
+
+    state = RNG.unpack_from(data, offset)
+    rng = random.Random(0)
+    rng.setstate((3, state[:625], state[626] if state[625] else None))
+
+    log = default_event_log() if recorded else None
+    recorder = GameRecorder.resume(log, game_id, rng) if log else None
+    game = ScrabbleGame(validator=validator, word_cache=word_cache, rng=rng, recorder=recorder,
+                        ruleset=ruleset.rstrip(b'\0').decode('ascii'))
+    bag = game.bag
+    if bag.letters == tuple(LETTERS):
+        bag.set_counts(bag_counts[:26])
+    else:
+        bag.set_counts(bag_counts[TILES.index(letter)] for letter in bag.letters)
+    return GameSession.restore(game, players, current_player, turn_counter, max_turns, bool(over))
+
+
+def save(session, path):
+    with open(path, 'wb') as f:
+        f.write(dumps(session))
+
+
+def load(path, validator=None, word_cache=None):
+    with open(path, 'rb') as f:
+        return loads(f.read(), validator, word_cache)
@@ -1,106 +1,57 @@
-import random
-from collections import Counter
-import requests
+import os
+import sys
 import time
-import customtkinter as ctk
-import tkinter as tk
-from tkinter import messagebox
-
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("blue")
-
-class ScrabbleGame:
-    def __init__(self):
-        self.tile_bag = {
-            'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12,
-            'F': 2, 'G': 3, 'H': 2, 'I': 9, 'J': 1,
-            'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8,
-            'P': 2, 'Q': 1, 'R': 6, 'S': 4, 'T': 6,
-            'U': 4, 'V': 2, 'W': 2, 'X': 1, 'Y': 2, 'Z': 1
-        }
-        self.letter_scores = {
-            'A': 1, 'B': 3, 'C': 3, 'D': 2, 'E': 1,
-            'F': 4, 'G': 2, 'H': 4, 'I': 1, 'J': 8,
-            'K': 5, 'L': 1, 'M': 3, 'N': 1, 'O': 1,
-            'P': 3, 'Q': 10, 'R': 1, 'S': 1, 'T': 1,
-            'U': 1, 'V': 4, 'W': 4, 'X': 8, 'Y': 4, 'Z': 10
-        }
-        self.remaining_tiles = sum(self.tile_bag.values())
-        self.word_cache = {}
-
-    def is_valid_dictionary_word(self, word):
-        
-        if word in self.word_cache:
-            return self.word_cache[word]
+from concurrent.futures import ThreadPoolExecutor
+from scrabble_core import ScrabbleGame
+from game_session import Player
+from probability import unseen_tiles
+from rack import Rack
+from metrics import METRICS, timed
+
+# How long typing must pause before the entry is checked in the background.
+CHECK_DELAY_MS = 250
+# Thinking time for the computer opponent's moves.
+COMPUTER_BUDGET_MS = 200
+
+# The Tk toolkit is imported by load_toolkit() on first use, so importing
+# this module for ScrabbleGame works without a display.
+ctk = None
+messagebox = None
 
-        try:
-            url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word.lower()}"
-            response = requests.get(url)
-            
-            is_valid = response.status_code == 200
-            self.word_cache[word] = is_valid
-            
-            time.sleep(0.5)
-            
-            return is_valid
-        except requests.RequestException as e:
-            print(f"Warning: Could not verify word due to API error: {e}")
-            return True
-
-    def draw_tiles(self, count):
-        """Draw random tiles from the bag."""
-        if count > self.remaining_tiles:
-            raise ValueError("Not enough tiles left.")
-        
-        tiles = []
-        while len(tiles) < count:
-            available_letters = [
-                letter for letter, freq in self.tile_bag.items() if freq > 0
-            ]
-            letter = random.choice(available_letters)
-            tiles.append(letter)
-            self.tile_bag[letter] -= 1
-            self.remaining_tiles -= 1
-
-        return tiles
-
-    def calculate_score(self, word):
-        """Calculate the score for a word."""
-        return sum(self.letter_scores.get(letter.upper(), 0) for letter in word)
-
-    def is_valid_word(self, word, player_tiles):
-        """Check if a word is valid and can be formed from player's tiles."""
-        player_counter = Counter(player_tiles)
-        word_counter = Counter(word.upper())
-        for letter, count in word_counter.items():
-            if count > player_counter.get(letter, 0):
-                return False, "Cannot form the word with available tiles."
-
-        if not self.is_valid_dictionary_word(word):
-            return False, "Word not found in dictionary."
-        
-        return True, "Valid word."
-
-    def replenish_tiles(self, player_tiles):
-        """Replenish player's tiles to maintain 7 tiles."""
-        tiles_needed = min(7 - len(player_tiles), self.remaining_tiles)
-        if tiles_needed > 0:
-            new_tiles = self.draw_tiles(tiles_needed)
-            return player_tiles + new_tiles
-        return player_tiles
 
+def load_toolkit():
+    global ctk, messagebox
+    if ctk is None:
+        import customtkinter
+        from tkinter import messagebox as tk_messagebox
 
+        customtkinter.set_appearance_mode("dark")
+        customtkinter.set_default_color_theme("blue")
+        ctk, messagebox = customtkinter, tk_messagebox
 
 
 class ScrabbleGUI:
-    def __init__(self, root):
+    def __init__(self, root, computer_opponent=False, watchdog=False):
+        load_toolkit()
         root.attributes('-alpha', 0.9)
 
         self.game = ScrabbleGame()
-        self.players = [{"tiles": [], "score": 0}, {"tiles": [], "score": 0}]
+        self.players = [Player(Rack()), Player(Rack())]
         self.current_player = 0
         self.turn_counter = 0  # Add turn counter
         self.max_turns = 10    # Set maximum turns
+        self.validation_pool = ThreadPoolExecutor(max_workers=1)  # Keeps word checks off the Tk thread
+        self.checks = {}  # (word, rack signature) -> future of is_valid_word
+        self.pending_check = None
+        self.latest_check = None
+        self.submit_check = None  # The check a submit is waiting on, never cancelled
+        self.computer = None  # Plays seat 2 when set
+        if computer_opponent:
+            from ai_player import MonteCarloPlayer
+            try:
+                self.computer = MonteCarloPlayer(self.game, budget_ms=COMPUTER_BUDGET_MS)
+            except RuntimeError as e:
+                print(f"Warning: {e} Starting a two player game instead.")
 
         # Setup GUI
         self.root = root
@@ -128,6 +79,10 @@ class ScrabbleGUI:
             corner_radius=20
         )
         self.word_entry.pack(pady=10)
+        self.word_entry.bind("<KeyRelease>", self.schedule_check)
+
+        self.word_status_label = ctk.CTkLabel(root, text="", font=('Arial', 12))
+        self.word_status_label.pack()
 
         # Buttons frame
         button_frame = ctk.CTkFrame(root)
@@ -142,7 +97,7 @@ class ScrabbleGUI:
             height=35,
             width=120
         )
-        self.submit_button.pack(side=tk.LEFT, padx=5)
+        self.submit_button.pack(side="left", padx=5)
 
         self.skip_button = ctk.CTkButton(
             button_frame,
@@ -153,7 +108,7 @@ class ScrabbleGUI:
             height=35,
             width=120
         )
-        self.skip_button.pack(side=tk.LEFT, padx=5)
+        self.skip_button.pack(side="left", padx=5)
 
         self.end_game_button = ctk.CTkButton(
             button_frame,
@@ -164,58 +119,210 @@ class ScrabbleGUI:
             height=35,
             width=120
         )
-        self.end_game_button.pack(side=tk.LEFT, padx=5)
+        self.end_game_button.pack(side="left", padx=5)
+
+        self.hint_button = ctk.CTkButton(
+            button_frame,
+            text="Hint",
+            command=self.show_hint,
+            corner_radius=20,
+            hover_color="#2196F3",
+            height=35,
+            width=120
+        )
+        self.hint_button.pack(side="left", padx=5)
+
+        self.watchdog = None  # Reports UI stalls at the end of the game when set
+        if watchdog:
+            from ui_watchdog import UIWatchdog
+            self.watchdog = UIWatchdog(root, self)
+            self.watchdog.start()
 
         self.start_game()
 
     def start_game(self):
-        for player in self.players:
-            player["tiles"] = self.game.draw_tiles(7)
+        for i, player in enumerate(self.players):
+            self.game.start_turn(i)
+            player.rack = Rack(self.game.draw_tiles(7))
+        self.game.start_turn(self.current_player)
         self.update_display()
 
     def update_display(self):
-        player = self.players[self.current_player]
-        self.player_tiles_label.configure(
-            text=f"Player {self.current_player + 1}'s Tiles: {' '.join(player['tiles'])}"
-        )
+        if self.computer_to_move():
+            # Keep the human's rack on screen rather than reveal the computer's.
+            self.player_tiles_label.configure(text=f"Your Tiles: {self.players[0].rack}")
+        else:
+            player = self.players[self.current_player]
+            self.player_tiles_label.configure(
+                text=f"Player {self.current_player + 1}'s Tiles: {player.rack}"
+            )
         self.score_label.configure(
-            text=f"Player 1: {self.players[0]['score']} | Player 2: {self.players[1]['score']}"
+            text=f"Player 1: {self.players[0].score} | Player 2: {self.players[1].score}"
         )
         self.turn_label.configure(
             text=f"Turn: {self.turn_counter}/{self.max_turns}"
         )
 
+    @timed('gui_submit_word')
     def submit_word(self):
         word = self.word_entry.get().strip().upper()
         if not word:
             messagebox.showerror("Error", "Enter a valid word!")
             return
 
+        future = self.check_word(word)
+        if future.done():
+            # Usually already checked while the word was being typed.
+            self.deliver(future, lambda result: self.finish_submit(word, result))
+            return
+        self.set_buttons_state("disabled")
+        self.info_label.configure(text=f"Checking '{word}'...")
+        self.submit_check = future
+        self.when_done(future, lambda result: self.finish_submit(word, result), lambda: self.resubmit_check(word))
+
+    def resubmit_check(self, word):
+        """Check word again for a submit whose check was cancelled before it ran."""
+        self.submit_check = self.check_word(word)
+        return self.submit_check
+
+    def check_word(self, word):
+        """Start (or reuse) the background check of word against the current rack."""
+        rack = self.players[self.current_player].rack
+        key = (word, rack.signature())
+        future = self.checks.get(key)
+        if future is None or future.cancelled() or (future.done() and future.exception() is not None):
+            # A failed check is not kept, so the next submit tries again.
+            future = self.checks[key] = self.validation_pool.submit(self.game.is_valid_word, word, rack.copy())
+        return future
+
+    def computer_to_move(self):
+        return self.computer is not None and self.current_player == 1
+
+    def schedule_check(self, event=None):
+        """Check the entry once typing pauses for CHECK_DELAY_MS."""
+        if self.computer_to_move():
+            return  # Checking against the computer's rack would reveal its tiles
+        if self.pending_check is not None:
+            self.root.after_cancel(self.pending_check)
+        self.pending_check = self.root.after(CHECK_DELAY_MS, self.check_entry)
+
+    def check_entry(self):
+        self.pending_check = None
+        if self.computer_to_move():
+            return
+        word = self.word_entry.get().strip().upper()
+        if self.latest_check is not None and self.latest_check is not self.submit_check:
+            self.latest_check.cancel()  # Only drops it if the worker has not started it
+        if not word:
+            self.latest_check = None
+            self.word_status_label.configure(text="")
+            return
+        future = self.latest_check = self.check_word(word)
+        self.when_done(future, lambda result: self.show_word_status(word, result))
+
+    def show_word_status(self, word, result):
+        if self.computer_to_move() or self.word_entry.get().strip().upper() != word:
+            return
+        is_valid, message = result
+        self.word_status_label.configure(
+            text=message,
+            text_color="#4CAF50" if is_valid else "#F44336"
+        )
+        if is_valid:
+            leave = self.players[self.current_player].rack.copy()
+            leave.consume(word)
+            opponent = self.players[1 - self.current_player].rack
+            self.run_in_background(
+                lambda odds: self.show_leave_odds(word, message, odds),
+                self.game.bingo_probability, list(leave), unseen_tiles(self.game, opponent)
+            )
+
+    def show_leave_odds(self, word, message, odds):
+        """Add the chance that the tiles left after word draw into a bingo."""
+        if odds is None or self.computer_to_move() or self.word_entry.get().strip().upper() != word:
+            return
+        self.word_status_label.configure(text=f"{message} Leave bingo chance: {odds:.1%}")
+
+    def run_in_background(self, callback, function, *args):
+        """Run function on the worker thread and hand its result to callback on the Tk thread."""
+        self.when_done(self.validation_pool.submit(function, *args), callback)
+
+    def when_done(self, future, callback, retry=None):
+        """Hand future's result to callback on the Tk thread.
+
+        If the future is cancelled, retry (when given) supplies a new one to
+        wait on; otherwise the callback is dropped.
+        """
+        self.root.after(0 if future.done() else 50, self.poll_background, future, callback, time.perf_counter(), retry)
+
+    def poll_background(self, future, callback, started, retry=None):
+        if future.cancelled():
+            if retry is None:
+                return
+            future = retry()
+        if not future.done():
+            self.root.after(50, self.poll_background, future, callback, started, retry)
+            return
+        if METRICS.enabled:
+            METRICS.observe('gui_background_wait', (time.perf_counter() - started) * 1000)
+        self.deliver(future, callback)
+
+    def deliver(self, future, callback):
+        """Pass a finished future's result to callback, or report its error."""
+        try:
+            result = future.result()
+        except Exception as e:
+            # Don't leave the buttons disabled by the submit, hint or computer turn.
+            self.submit_check = None
+            self.set_buttons_state("normal")
+            self.info_label.configure(text="Welcome to Scrabble!")
+            messagebox.showerror("Error", f"Something went wrong in the background: {e}")
+            return
+        callback(result)
+
+    @timed('gui_finish_submit')
+    def finish_submit(self, word, result):
+        self.submit_check = None
+        self.set_buttons_state("normal")
+        self.info_label.configure(text="Welcome to Scrabble!")
         player = self.players[self.current_player]
-        is_valid, message = self.game.is_valid_word(word, player["tiles"])
+        is_valid, message = result
         if not is_valid:
             messagebox.showerror("Error", message)
             return
 
-        # Calculate score
-        score = self.game.calculate_score(word)
-        player["score"] += score
-
-        # Remove used tiles and replenish
-        for letter in word:
-            player["tiles"].remove(letter)
-        player["tiles"] = self.game.replenish_tiles(player["tiles"])
+        # Remove used tiles, replenish and score
+        score = self.game.play_word(word, player.rack)
+        player.score += score
 
         messagebox.showinfo("Success", f"Word accepted! You scored {score} points.")
         self.next_turn()
 
+    def show_hint(self):
+        player = self.players[self.current_player]
+        self.set_buttons_state("disabled")
+        self.run_in_background(self.finish_hint, self.game.best_plays, player.rack.copy(), 5)
+
+    def finish_hint(self, plays):
+        self.set_buttons_state("normal")
+        if not plays:
+            messagebox.showinfo("Hint", "No hints available.")
+            return
+        messagebox.showinfo("Hint", "\n".join(f"{word}: {score} points" for word, score in plays))
+
+    def set_buttons_state(self, state):
+        for button in (self.submit_button, self.skip_button, self.end_game_button, self.hint_button):
+            button.configure(state=state)
+
+    @timed('gui_skip_turn')
     def skip_turn(self):
         # Refresh tiles for the skipping player
         player = self.players[self.current_player]
-        player["tiles"] = self.game.draw_tiles(7)  # Draw a new set of tiles
+        player.rack.exchange(self.game)  # Swap for a new set of tiles
         #messagebox.showinfo("Turn Skipped", "Your tiles have been refreshed.")
         self.next_turn()
 
+    @timed('gui_next_turn')
     def next_turn(self):
         self.turn_counter += 1
         if self.turn_counter > self.max_turns:
@@ -223,22 +330,61 @@ class ScrabbleGUI:
             return
 
         self.current_player = 1 - self.current_player
-        self.word_entry.delete(0, tk.END)
+        self.game.start_turn(self.current_player)
+        self.checks.clear()
+        self.word_entry.delete(0, "end")
+        self.word_status_label.configure(text="")
         self.update_display()
+        if self.computer and self.current_player == 1:
+            self.play_computer_turn()
+
+    def play_computer_turn(self):
+        self.set_buttons_state("disabled")
+        self.info_label.configure(text="Computer is thinking...")
+        opponent = self.players[0].rack
+        self.run_in_background(
+            self.finish_computer_turn, self.computer.choose,
+            self.players[1].rack.copy(), unseen_tiles(self.game, opponent), len(opponent)
+        )
+
+    def finish_computer_turn(self, word):
+        player = self.players[1]
+        if word is None:
+            player.rack.exchange(self.game)
+            self.info_label.configure(text="Computer swapped its tiles.")
+        else:
+            score = self.game.play_word(word, player.rack)
+            player.score += score
+            self.info_label.configure(text=f"Computer played {word} for {score} points.")
+        self.set_buttons_state("normal")
+        self.next_turn()
 
+    @timed('gui_end_game')
     def end_game(self):
-        player1_score = self.players[0]["score"]
-        player2_score = self.players[1]["score"]
+        player1_score = self.players[0].score
+        player2_score = self.players[1].score
+        self.game.finish([player1_score, player2_score])
         winner = (
             "Player 1" if player1_score > player2_score else
             "Player 2" if player2_score > player1_score else
             "No one (tie)"
         )
         messagebox.showinfo("Game Over", f"Final Scores:\nPlayer 1: {player1_score}\nPlayer 2: {player2_score}\nWinner: {winner}")
+        self.validation_pool.shutdown(wait=False)
+        if self.computer:
+            self.computer.close()
+        if self.watchdog:
+            self.watchdog.stop()
+            print(self.watchdog.report(), file=sys.stderr)
         self.root.quit()
 
 if __name__ == "__main__":
+    load_toolkit()
     root = ctk.CTk()
     root.geometry("700x300")
-    gui = ScrabbleGUI(root)
+    gui = ScrabbleGUI(
+        root,
+        computer_opponent="--computer" in sys.argv[1:],
+        watchdog="--watchdog" in sys.argv[1:] or bool(os.environ.get('SCRABBLE_UI_WATCHDOG'))
+    )
     root.mainloop()
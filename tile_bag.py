@@ -0,0 +1,99 @@
+import random
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
+
+
+@lru_cache(maxsize=64)
+def _layout(letters):
+    # Bags with the same letters share one letters tuple, read-only index and tree step.
+    index = MappingProxyType({letter: i for i, letter in enumerate(letters)})
+    return letters, index, 1 << (len(letters).bit_length() - 1) if letters else 0
+
+
+class TileBag:
+    """Bag of tiles stored as per-letter counts.
+
+    A Fenwick tree over the counts finds the letter for a random position in
+    the bag, so frequency-weighted draws and returns are O(log n) in the
+    number of distinct letters and allocate nothing. Only the counts and
+    tree, as small unsigned arrays, belong to each bag.
+    """
+
+    __slots__ = ('letters', 'index', 'counts', 'tree', 'total', 'rng', '_top')
+
+    def __init__(self, distribution, rng=None):
+        self.letters, self.index, self._top = _layout(tuple(distribution))
+        self.counts = array('I', [0]) * len(self.letters)
+        self.tree = array('I', [0]) * (len(self.letters) + 1)
+        self.total = 0
+        self.rng = rng if rng is not None else random.Random()
+        for letter, count in distribution.items():
+            self._add(self.index[letter], count)
+
+    def _add(self, i, delta):
+        self.counts[i] += delta
+        self.total += delta
+        tree = self.tree
+        i += 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _find(self, target):
+        # Index of the letter holding the target-th tile (0-based) in the bag.
+        tree = self.tree
+        position = 0
+        step = self._top
+        while step:
+            following = position + step
+            if following < len(tree) and tree[following] <= target:
+                position = following
+                target -= tree[following]
+            step >>= 1
+        return position
+
+    def draw(self):
+        """Draw one tile, weighted by how many of each letter are left."""
+        if not self.total:
+            raise ValueError("The tile bag is empty.")
+        i = self._find(self.rng.randrange(self.total))
+        self._add(i, -1)
+        return self.letters[i]
+
+    def draw_many(self, count):
+        """Draw count tiles."""
+        if count > self.total:
+            raise ValueError(f"Not enough tiles in bag. Only {self.total} remaining.")
+        return [self.draw() for _ in range(count)]
+
+    def put_back(self, letter):
+        """Return a tile to the bag."""
+        self._add(self.index[letter], 1)
+
+    def exchange(self, tiles):
+        """Return tiles to the bag and draw the same number of new ones."""
+        for tile in tiles:
+            self.put_back(tile)
+        return self.draw_many(len(tiles))
+
+    def set_counts(self, counts):
+        """Replace the bag's contents with counts, given in the order of letters."""
+        self.counts = array('I', [0]) * len(self.letters)
+        self.tree = array('I', [0]) * (len(self.letters) + 1)
+        self.total = 0
+        for i, count in enumerate(counts):
+            if count:
+                self._add(i, count)
+
+    def count(self, letter):
+        return self.counts[self.index[letter]]
+
+    def as_dict(self):
+        return dict(zip(self.letters, self.counts))
+
+    def __contains__(self, letter):
+        return letter in self.index
+
+    def __len__(self):
+        return self.total
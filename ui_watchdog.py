@@ -0,0 +1,149 @@
+import inspect
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+
+from metrics import METRICS, Histogram
+
+
+class HandlerStalls:
+    __slots__ = ('count', 'total_ms', 'max_ms', 'stacks')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.stacks = Counter()
+
+    def add(self, milliseconds, stack):
+        self.count += 1
+        self.total_ms += milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+        if stack:
+            self.stacks[stack] += 1
+
+
+class UIWatchdog:
+    """Measures how late a Tk event loop runs its timers and explains the stalls.
+
+    A heartbeat scheduled with root.after every interval_ms records how late
+    it ran. A sampler thread checks on the heartbeat, and once it is more
+    than threshold_ms overdue takes a sample of the Tk thread's stack with
+    sys._current_frames(). Each stall is charged to the handler on that
+    stack, the outermost of owner's methods (with the innermost one too if
+    it differs), so the report lists stall counts, durations and the usual
+    stack per handler.
+
+    Create and start it on the Tk thread.
+    """
+
+    def __init__(self, root, owner, interval_ms=50, threshold_ms=100, top_frames=8):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.top_frames = top_frames
+        self.handlers = {}
+        for name, function in inspect.getmembers(type(owner), inspect.isfunction):
+            self.handlers[inspect.unwrap(function).__code__] = name
+        self.lag = Histogram()
+        self.max_lag_ms = 0.0
+        self.stalls = {}
+        self._thread_id = None
+        self._due = None
+        self._sample = None
+        self._after_id = None
+        self._stop = threading.Event()
+        self._sampler = None
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        self._stop.clear()
+        self._schedule()
+        self._sampler = threading.Thread(target=self._watch, name='ui-watchdog', daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        """Stop watching; a stall still in progress (such as the caller's own) is counted."""
+        self._stop.set()
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+            self._end_stall((time.perf_counter() - self._due) * 1000)
+        if self._sampler is not None and self._sampler is not threading.current_thread():
+            self._sampler.join()
+        self._sampler = None
+
+    def _schedule(self):
+        self._due = time.perf_counter() + self.interval_ms / 1000
+        self._after_id = self.root.after(self.interval_ms, self._beat)
+
+    def _beat(self):
+        lag_ms = max(0.0, (time.perf_counter() - self._due) * 1000)
+        self.lag.observe(lag_ms)
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        if METRICS.enabled:
+            METRICS.observe('ui_event_loop_lag', lag_ms)
+        self._end_stall(lag_ms)
+        if not self._stop.is_set():
+            self._schedule()
+
+    def _end_stall(self, lag_ms):
+        sample, self._sample = self._sample, None
+        if lag_ms < self.threshold_ms:
+            return
+        handler, stack = sample or ('(not sampled)', None)
+        stalls = self.stalls.get(handler)
+        if stalls is None:
+            stalls = self.stalls[handler] = HandlerStalls()
+        stalls.add(lag_ms, stack)
+        if METRICS.enabled:
+            METRICS.increment('ui_stalls')
+            METRICS.observe(f'ui_stall {handler}', lag_ms)
+
+    def _watch(self):
+        period = self.threshold_ms / 4000
+        while not self._stop.wait(period):
+            due = self._due
+            if self._sample is None and due is not None and (time.perf_counter() - due) * 1000 >= self.threshold_ms:
+                frame = sys._current_frames().get(self._thread_id)
+                if frame is not None:
+                    self._sample = self._describe(frame)
+                del frame
+
+    def _describe(self, frame):
+        # The handler is the outermost of the owner's methods on the stack,
+        # the one Tk called, followed by the innermost when they differ.
+        names = [self.handlers[caller.f_code] for caller in _frames(frame) if caller.f_code in self.handlers]
+        if not names:
+            handler = '(other)'
+        elif len(names) == 1:
+            handler = names[0]
+        else:
+            handler = f"{names[-1]} > {names[0]}"
+        stack = traceback.extract_stack(frame)[-self.top_frames:]
+        return handler, tuple(f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in stack)
+
+    def report(self):
+        """Text summary of event loop lag and the stalls charged to each handler."""
+        lines = [
+            f"Event loop lag: {self.lag.count} heartbeats, mean {self.lag.total / self.lag.count if self.lag.count else 0:.1f} ms, "
+            f"max {self.max_lag_ms:.1f} ms; stalls over {self.threshold_ms} ms:"
+        ]
+        if not self.stalls:
+            lines.append("  none")
+        ranked = sorted(self.stalls.items(), key=lambda item: -item[1].total_ms)
+        for handler, stalls in ranked:
+            lines.append(f"  {handler}: {stalls.count} stalls, {stalls.total_ms:.0f} ms total, {stalls.max_ms:.0f} ms max")
+            if stalls.stacks:
+                stack, seen = stalls.stacks.most_common(1)[0]
+                lines.append(f"    usual stack ({seen} of {stalls.count} samples):")
+                lines.extend(f"      {entry}" for entry in stack)
+        return '\n'.join(lines)
+
+
+def _frames(frame):
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
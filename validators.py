@@ -0,0 +1,104 @@
+from lexicon import load_default_lexicon
+
+
+class WordValidator:
+    """Base class for the dictionary check used by ScrabbleGame.
+
+    is_valid returns True or False, or None when the word could not be
+    checked (e.g. the remote API is unreachable).
+    """
+
+    remote = False
+    lexicon = None
+    prefilter = None
+
+    def is_valid(self, word):
+        raise NotImplementedError
+
+
+class LexiconValidator(WordValidator):
+    """Check words against a local lexicon."""
+
+    def __init__(self, lexicon):
+        self.lexicon = lexicon
+
+    def is_valid(self, word):
+        return word in self.lexicon
+
+
+class DictionaryAPIValidator(WordValidator):
+    """Check words using the Free Dictionary API."""
+
+    remote = True
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            from dictionary_client import default_client
+            self._client = default_client()
+        return self._client
+
+    def is_valid(self, word):
+        return self.client.lookup(word)
+
+    def is_valid_many(self, words):
+        """Check several words concurrently; returns a dict of word -> result."""
+        return self.client.lookup_many(words)
+
+
+class PrefilteredValidator(WordValidator):
+    """Reject words missing from a Bloom filter before asking the wrapped validator.
+
+    ScrabbleGame checks the prefilter before its word cache too, so
+    nonsense words never reach the cache or the network.
+    """
+
+    def __init__(self, prefilter, validator):
+        self.prefilter = prefilter
+        self.validator = validator
+        self.remote = validator.remote
+        self.lexicon = validator.lexicon
+
+    def is_valid(self, word):
+        if word not in self.prefilter:
+            return False
+        return self.validator.is_valid(word)
+
+
+class FallbackValidator(WordValidator):
+    """Accept a word if any of the validators accepts it, asking them in order."""
+
+    def __init__(self, *validators):
+        self.validators = validators
+        self.remote = any(v.remote for v in validators)
+        self.lexicon = next((v.lexicon for v in validators if v.lexicon is not None), None)
+
+    def is_valid(self, word):
+        result = False
+        for validator in self.validators:
+            is_valid = validator.is_valid(word)
+            if is_valid:
+                return True
+            if is_valid is None:
+                result = None
+        return result
+
+
+def default_validator(use_api_fallback=False):
+    """Use the local lexicon if there is one, otherwise the dictionary API.
+
+    The API is put behind the saved Bloom filter when there is one.
+    """
+    lexicon = load_default_lexicon()
+    if lexicon is None:
+        from bloom import load_default_bloom
+        bloom = load_default_bloom()
+        if bloom is not None:
+            return PrefilteredValidator(bloom, DictionaryAPIValidator())
+        return DictionaryAPIValidator()
+    if use_api_fallback:
+        return FallbackValidator(LexiconValidator(lexicon), DictionaryAPIValidator())
+    return LexiconValidator(lexicon)
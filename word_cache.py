@@ -0,0 +1,185 @@
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+CACHE_PATH = os.environ.get(
+    'SCRABBLE_WORD_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'scrabble', 'word_cache.sqlite3')
+)
+
+
+class PersistentWordCache:
+    """Word validity cache kept in SQLite so it survives restarts and is shared
+    between processes.
+
+    Both valid and invalid words are stored. Entries older than ttl seconds
+    are dropped, and once there are more than max_entries the least recently
+    used ones are evicted. A hit only records its use once the last record
+    is more than touch_interval seconds old (ttl / 100 by default), so warm
+    reads do not take SQLite's write lock. Supports the get/[] subset of the dict interface
+    ScrabbleGame uses for its word cache.
+    """
+
+    def __init__(self, path=CACHE_PATH, max_entries=100000, ttl=30 * 24 * 3600, evict_every=100, touch_interval=None):
+        # Imported here so processes that only use local lexicons never load sqlite3.
+        import sqlite3
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evict_every = evict_every
+        self.touch_interval = ttl / 100 if touch_interval is None else touch_interval
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS words ("
+            "word TEXT PRIMARY KEY, valid INTEGER NOT NULL, stored REAL NOT NULL, used REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS words_used ON words (used)")
+
+    def get(self, word, default=None):
+        """Return the cached validity of word, or default on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT valid, stored, used FROM words WHERE word = ?", (word,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return default
+            self.hits += 1
+            if now - row[2] > self.touch_interval:
+                self._connection.execute("UPDATE words SET used = ? WHERE word = ?", (now, word))
+        return bool(row[0])
+
+    def __getitem__(self, word):
+        is_valid = self.get(word)
+        if is_valid is None:
+            raise KeyError(word)
+        return is_valid
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def __setitem__(self, word, is_valid):
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO words (word, valid, stored, used) VALUES (?, ?, ?, ?)",
+                (word, int(is_valid), now, now)
+            )
+            self._writes += 1
+            if self._writes % self.evict_every == 0:
+                self._evict(now)
+
+    def _evict(self, now):
+        self._connection.execute("DELETE FROM words WHERE stored < ?", (now - self.ttl,))
+        self._connection.execute(
+            "DELETE FROM words WHERE word IN "
+            "(SELECT word FROM words ORDER BY used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def evict(self):
+        """Drop expired entries and trim the cache to max_entries."""
+        with self._lock:
+            self._evict(time.time())
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+
+    def stats(self):
+        """Return hit/miss counters for this process."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'entries': len(self),
+        }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class MemoryWordCache:
+    """Word validity cache held in memory, evicting the least recently used
+    words once it holds max_entries.
+
+    One is shared by every game in a process that uses the same validator,
+    so games do not each grow a dict of their own.
+    """
+
+    def __init__(self, max_entries=50000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, word, default=None):
+        with self._lock:
+            is_valid = self._entries.get(word)
+            if is_valid is None:
+                return default
+            self._entries.move_to_end(word)
+            return is_valid
+
+    def __getitem__(self, word):
+        is_valid = self.get(word)
+        if is_valid is None:
+            raise KeyError(word)
+        return is_valid
+
+    def __contains__(self, word):
+        return word in self._entries
+
+    def __setitem__(self, word, is_valid):
+        with self._lock:
+            self._entries[word] = is_valid
+            self._entries.move_to_end(word)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_shared_cache = None
+_memory_caches = weakref.WeakKeyDictionary()
+
+
+def default_word_cache(validator):
+    """Share one persistent cache per process for remote validators.
+
+    Local lexicon lookups are already fast, so those games (and remote ones
+    if the persistent cache cannot be opened) share a bounded in-memory
+    cache per validator instead.
+    """
+    global _shared_cache
+    if validator.remote:
+        if _shared_cache is None:
+            import sqlite3
+            try:
+                _shared_cache = PersistentWordCache()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: Could not open word cache at {CACHE_PATH}: {e}")
+        if _shared_cache is not None:
+            return _shared_cache
+    cache = _memory_caches.get(validator)
+    if cache is None:
+        cache = _memory_caches[validator] = MemoryWordCache()
+    return cache
@@ -0,0 +1,48 @@
+import weakref
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+
+from rack import BLANK, LETTERS
+
+
+class WordFinder:
+    """Index of words by their sorted letters, for listing every word a rack can make.
+
+    A 7 tile rack has at most 127 sub-multisets, so finding its words is a
+    handful of dict lookups. Results are kept in an LRU cache keyed by the
+    rack's signature.
+    """
+
+    def __init__(self, words, cache_size=4096):
+        self.index = {}
+        for word in words:
+            self.index.setdefault(''.join(sorted(word)), []).append(word)
+        self.find = lru_cache(maxsize=cache_size)(self._find)
+
+    def _find(self, signature):
+        """Return (word, blank_letters) for every word the rack signature can make."""
+        letters = signature.replace(BLANK, '')
+        blanks = len(signature) - len(letters)
+        found = {}
+        for blank_count in range(blanks + 1):
+            fills = list(combinations_with_replacement(LETTERS, blank_count))
+            for size in range(len(letters) + 1):
+                for subset in set(combinations(letters, size)):
+                    for fill in fills:
+                        key = ''.join(sorted(subset + fill)) if fill else ''.join(subset)
+                        for word in self.index.get(key, ()):
+                            # Fewer blanks score higher, so keep the first way found.
+                            found.setdefault(word, ''.join(fill))
+        return tuple(found.items())
+
+
+# Weak keys, so a reloaded lexicon's old index goes once no game uses it.
+_finders = weakref.WeakKeyDictionary()
+
+
+def word_finder_for(lexicon):
+    """Build the finder for a lexicon once per process and share it."""
+    finder = _finders.get(lexicon)
+    if finder is None:
+        finder = _finders[lexicon] = WordFinder(lexicon)
+    return finder